@@ -1,17 +1,35 @@
-# Sync decorators
-# Async decorators
-from .async_ import (
-    memoize_async,
-    retry_async,
-    timeit_async,
-    with_pause_async,
-)
-from .sync import (
-    memoize,
-    retry,
-    timeit,
-    with_pause,
-)
+# Chargement paresseux : `sync` et `async_` (donc asyncio) ne sont importés
+# qu'au premier accès à l'un de leurs décorateurs.
+from typing import TYPE_CHECKING
+
+from python_tools_sl.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Async decorators
+    from .async_ import (
+        debounce_async,
+        memoize_async,
+        profile_async,
+        retry_async,
+        throttle_async,
+        timeit_async,
+        timeout_async,
+        trace_memory_async,
+        with_pause_async,
+    )
+
+    # Sync decorators
+    from .sync import (
+        debounce,
+        memoize,
+        profile,
+        retry,
+        throttle,
+        timeit,
+        timeout,
+        trace_memory,
+        with_pause,
+    )
 
 __all__ = [
     # Sync
@@ -19,9 +37,24 @@ __all__ = [
     "retry",
     "timeit",
     "with_pause",
+    "profile",
+    "trace_memory",
+    "timeout",
+    "debounce",
+    "throttle",
     # Async
     "memoize_async",
     "retry_async",
     "timeit_async",
     "with_pause_async",
+    "profile_async",
+    "trace_memory_async",
+    "timeout_async",
+    "debounce_async",
+    "throttle_async",
 ]
+
+if not TYPE_CHECKING:  # mypy ne voit que les imports ci-dessus
+    __getattr__, __dir__ = lazy_exports(
+        __name__, {name: ".async_" if name.endswith("_async") else ".sync" for name in __all__}
+    )
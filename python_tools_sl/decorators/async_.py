@@ -1,11 +1,27 @@
 import asyncio
 import time
-from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+from collections import OrderedDict, deque
+from functools import partial, wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+    overload,
+)
 
 from python_tools_sl.utils.formatting import format_duration
 from python_tools_sl.utils.typing_helpers import AsyncDecorator, P, R
 
+# Les métriques, les deadlines et le profilage sont importés par chaque décorateur
+# au moment de la décoration : importer ce module ne charge que ce qu'il utilise.
+
 
 def with_pause_async(seconds: int | float = 2, message: Optional[str] = None) -> AsyncDecorator:
     """
@@ -30,11 +46,16 @@ def with_pause_async(seconds: int | float = 2, message: Optional[str] = None) ->
     """
 
     def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        from python_tools_sl.metrics.instruments import PAUSE_SECONDS, function_label, record
+
+        label = function_label(func)
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             result = await func(*args, **kwargs)
             print(message or f"⏸️ Pause de {seconds}s pour éviter les timeouts...")
             await asyncio.sleep(seconds)
+            record(PAUSE_SECONDS, label, seconds)
             return result
 
         return wrapper
@@ -68,12 +89,17 @@ def timeit_async(prefix: str = "[ASYNC TIMEIT]") -> AsyncDecorator:
     """
 
     def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        from python_tools_sl.metrics.instruments import TIMEIT_SECONDS, function_label, record
+
+        label = function_label(func)
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start = time.perf_counter()
             result = await func(*args, **kwargs)
             end = time.perf_counter()
             print(f"{prefix} {func.__name__} exécutée en {format_duration(end - start)}")
+            record(TIMEIT_SECONDS, label, end - start)
             return result
 
         return wrapper
@@ -81,10 +107,130 @@ def timeit_async(prefix: str = "[ASYNC TIMEIT]") -> AsyncDecorator:
     return decorator
 
 
+class HedgePolicy:
+    """
+    Politique de requêtes « hedgées » (doublées) utilisée par `retry_async`.
+
+    Le délai avant de lancer une tentative supplémentaire est soit fixe
+    (`hedge_after`), soit appris : le percentile `percentile` des latences des
+    derniers succès, dès que `min_samples` mesures sont disponibles (avant cela,
+    `hedge_after` sert de valeur par défaut s'il est fourni).
+
+    La charge supplémentaire est bornée par un budget : chaque appel crédite
+    `budget` jeton (plafonné à `max_tokens`), chaque tentative supplémentaire en
+    coûte un. Le budget part de `initial_tokens` (vide par défaut) : avec
+    `budget=0.1`, au plus ~10 % d'appels en plus sont envoyés, et aucun avec 0.
+
+    Args:
+        hedge_after (float, optionnel): Délai fixe en secondes.
+        percentile (float, optionnel): Percentile de latence (ex. 95) pour le délai appris.
+        budget (float): Fraction maximale de tentatives supplémentaires. Par défaut 0.1.
+        window (int): Nombre de latences conservées. Par défaut 200.
+        min_samples (int): Mesures nécessaires avant d'utiliser le percentile. Par défaut 20.
+        max_tokens (float): Plafond du budget accumulé. Par défaut 10.
+        initial_tokens (float): Jetons disponibles au départ. Par défaut 0.
+    """
+
+    def __init__(
+        self,
+        hedge_after: Optional[float] = None,
+        percentile: Optional[float] = None,
+        budget: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+        max_tokens: float = 10.0,
+        initial_tokens: float = 0.0,
+    ) -> None:
+        self.hedge_after = hedge_after
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.max_tokens = max_tokens
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.tokens = min(initial_tokens, max_tokens)
+        self.hedges = 0
+
+    def delay(self) -> Optional[float]:
+        """Délai avant la prochaine tentative supplémentaire, ou None pour ne pas hedger."""
+        if self.percentile is not None and len(self.latencies) >= self.min_samples:
+            ordered = sorted(self.latencies)
+            index = min(int(len(ordered) * self.percentile / 100), len(ordered) - 1)
+            return ordered[index]
+        return self.hedge_after
+
+    def on_call(self) -> None:
+        self.tokens = min(self.tokens + self.budget, self.max_tokens)
+
+    def try_hedge(self) -> bool:
+        """Consomme un jeton du budget si possible."""
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        self.hedges += 1
+        return True
+
+    def record(self, latency: float) -> None:
+        self.latencies.append(latency)
+
+    async def run(self, make_call: Callable[[], Awaitable[R]], max_hedges: int = 1) -> R:
+        """
+        Exécute `make_call()` en lançant jusqu'à `max_hedges` copies concurrentes.
+
+        Une copie supplémentaire démarre chaque fois que les tentatives en cours
+        n'ont pas abouti après `delay()` secondes (si le budget le permet). Le
+        premier succès est retourné et les autres tentatives sont annulées ; si
+        toutes échouent, la dernière exception est levée.
+        """
+
+        async def timed() -> Tuple[R, float]:
+            start = time.perf_counter()
+            result = await make_call()
+            return result, time.perf_counter() - start
+
+        self.on_call()
+        tasks = [asyncio.ensure_future(timed())]
+        launched = 1
+        last_exc: Optional[BaseException] = None
+        try:
+            while tasks:
+                delay = self.delay() if launched <= max_hedges else None
+                done, _ = await asyncio.wait(
+                    tasks, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if self.try_hedge():
+                        tasks.append(asyncio.ensure_future(timed()))
+                        launched += 1
+                    else:
+                        launched = max_hedges + 1  # budget épuisé : on attend
+                    continue
+                winner = None
+                for task in done:  # lire chaque exception, même après un succès
+                    tasks.remove(task)
+                    exc = task.exception()
+                    if exc is not None:
+                        last_exc = exc
+                    elif winner is None:
+                        winner = task
+                if winner is not None:
+                    result, latency = winner.result()
+                    self.record(latency)
+                    return result
+            assert last_exc is not None
+            raise last_exc
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
 def retry_async(
     max_attempts: int = 3,
     delay: float = 1.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    hedge_after: Optional[float] = None,
+    hedge_percentile: Optional[float] = None,
+    max_hedges: int = 1,
+    hedge_budget: float = 0.1,
 ) -> AsyncDecorator:
     """
     Décorateur async qui réessaie l'exécution d'une fonction async en cas d'exception.
@@ -92,11 +238,25 @@ def retry_async(
     Ce décorateur est utile pour gérer des appels réseau instables, des opérations
     sensibles aux timeouts, ou toute coroutine susceptible d'échouer temporairement.
 
+    Avec `hedge_after` ou `hedge_percentile`, chaque tentative est aussi « hedgée » :
+    si elle n'a pas abouti après ce délai, une copie concurrente est lancée (jusqu'à
+    `max_hedges` copies), le premier résultat gagne et les autres sont annulées.
+    Une réponse lente, et pas seulement un échec, ne fixe donc plus la latence
+    (voir `HedgePolicy`).
+
+    Si une deadline est active (voir `timeout_async` et `python_tools_sl.utils.deadline`),
+    aucun nouvel essai n'est tenté lorsqu'elle tomberait pendant le délai d'attente.
+
     Args:
         max_attempts (int): Nombre maximum de tentatives. Par défaut 3.
         delay (float): Délai en secondes entre deux tentatives. Par défaut 1.0.
         exceptions (Tuple[Type[Exception], ...]): Types d'exceptions qui déclenchent
             un nouvel essai. Par défaut, toutes les exceptions (`Exception`).
+        hedge_after (float, optionnel): Délai fixe avant de lancer une copie.
+        hedge_percentile (float, optionnel): Percentile (ex. 95) des latences observées
+            utilisé comme délai appris ; `hedge_after` sert tant que les mesures manquent.
+        max_hedges (int): Nombre maximum de copies par tentative. Par défaut 1.
+        hedge_budget (float): Fraction maximale d'appels supplémentaires. Par défaut 0.1.
 
     Returns:
         AsyncDecorator: Un décorateur async qui peut être appliqué à une fonction async.
@@ -107,55 +267,573 @@ def retry_async(
             if x < 0:
                 raise ValueError("x doit être positif")
             return x * 2
+
+        @retry_async(hedge_percentile=95, max_hedges=1)
+        async def fetch(url: str) -> str:
+            return await http_get(url)
     """
+    hedging = hedge_after is not None or hedge_percentile is not None
 
     def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        from python_tools_sl.utils.deadline import remaining_time
+
+        policy = HedgePolicy(hedge_after, hedge_percentile, hedge_budget) if hedging else None
+        from python_tools_sl.metrics.instruments import (
+            RETRY_ATTEMPTS,
+            RETRY_FAILURES,
+            RETRY_GIVEUPS,
+            function_label,
+            record,
+        )
+
+        label = function_label(func)
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             last_exc = None
             for attempt in range(1, max_attempts + 1):
+                record(RETRY_ATTEMPTS, label)
                 try:
-                    return await func(*args, **kwargs)
+                    if policy is None:
+                        return await func(*args, **kwargs)
+                    return await policy.run(lambda: func(*args, **kwargs), max_hedges)
                 except exceptions as e:
                     last_exc = e
+                    record(RETRY_FAILURES, label)
                     print(f"⚠️ Tentative {attempt}/{max_attempts} échouée : {e}")
                     if attempt < max_attempts:
+                        remaining = remaining_time()
+                        if remaining is not None and remaining <= delay:
+                            break  # la deadline tombera avant le prochain essai
                         await asyncio.sleep(delay)
             if last_exc is not None:
+                record(RETRY_GIVEUPS, label)
                 raise last_exc
             raise RuntimeError("Échec du retry_async : aucune exception capturée")
 
+        wrapper.hedge_policy = policy  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
 
 
-def memoize_async(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+def timeout_async(seconds: Optional[float] = None) -> AsyncDecorator:
+    """
+    Décorateur async qui borne la durée d'une coroutine par annulation.
+
+    La coroutine est annulée si elle dépasse `seconds`, ou plus tôt si une deadline
+    englobante (`deadline`, `timeout_async` parent) expire avant. Le budget est
+    stocké dans une `ContextVar` : les `timeout_async` / `retry_async` imbriqués et les
+    tâches créées par la coroutine le voient et le respectent.
+
+    Args:
+        seconds (float, optionnel): Durée maximale en secondes. None : seule la
+            deadline englobante s'applique.
+
+    Returns:
+        AsyncDecorator: Un décorateur async qui peut être appliqué à une fonction async.
+
+    Raises:
+        DeadlineExceeded: Si la coroutine n'a pas terminé à temps (sous-classe de
+            `TimeoutError`).
+
+    Exemple:
+        @timeout_async(2.0)
+        async def fetch(url: str) -> str:
+            return await http_get(url)
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        from python_tools_sl.utils.deadline import DeadlineExceeded, deadline, remaining_time
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with deadline(seconds):
+                limit = remaining_time()
+                if limit is None:
+                    return await func(*args, **kwargs)
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                try:
+                    done, _ = await asyncio.wait({task}, timeout=limit)
+                finally:
+                    task.cancel()  # sans effet si la tâche est terminée
+                if not done:
+                    await asyncio.wait({task})  # laisse la coroutine traiter l'annulation
+                    raise DeadlineExceeded(
+                        f"{func.__name__} n'a pas terminé en {format_duration(limit)}"
+                    )
+                return task.result()
+
+        return wrapper
+
+    return decorator
+
+
+class _AsyncMemo:
+    """Cache de `memoize_async` : TTL, stale-while-revalidate et refresh-ahead."""
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        ttl: Optional[float],
+        stale_while_revalidate: float,
+        refresh_ahead: Optional[float],
+        refresh_min_hits: int,
+    ) -> None:
+        from python_tools_sl.metrics.instruments import (
+            MEMOIZE_HITS,
+            MEMOIZE_MISSES,
+            function_label,
+            record,
+        )
+
+        self.func = func
+        label = function_label(func)
+        self.record_hit = partial(record, MEMOIZE_HITS, label)
+        self.record_miss = partial(record, MEMOIZE_MISSES, label)
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_ahead = refresh_ahead
+        self.refresh_min_hits = refresh_min_hits
+        # clé -> [valeur, date de calcul (monotonic), hits depuis le calcul]
+        self.cache: Dict[Any, list[Any]] = {}
+        self.inflight: Dict[Any, "asyncio.Task[Any]"] = {}
+
+    async def compute(self, key: Any, args: Any, kwargs: Any) -> Any:
+        """Calcule la valeur ; les appels concurrents pour une même clé partagent le calcul.
+
+        Le calcul tourne dans sa propre tâche et chaque appelant l'attend via
+        `asyncio.shield` : annuler un appelant (timeout d'une requête...) n'annule
+        ni le calcul ni les autres appelants.
+        """
+        task = self.inflight.get(key)
+        if task is None:
+            task = self._start(key, args, kwargs)
+        return await asyncio.shield(task)
+
+    def _start(self, key: Any, args: Any, kwargs: Any) -> "asyncio.Task[Any]":
+        task = asyncio.create_task(self._run(key, args, kwargs))
+        self.inflight[key] = task
+        task.add_done_callback(lambda t: self._finished(key, t))
+        return task
+
+    async def _run(self, key: Any, args: Any, kwargs: Any) -> Any:
+        value = await self.func(*args, **kwargs)
+        self.cache[key] = [value, time.monotonic(), 0]
+        return value
+
+    def _finished(self, key: Any, task: "asyncio.Task[Any]") -> None:
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+        if not task.cancelled():
+            task.exception()  # marquée comme lue, même si plus personne n'attend
+
+    def refresh_in_background(self, key: Any, args: Any, kwargs: Any) -> None:
+        if key in self.inflight:
+            return
+        self._start(key, args, kwargs).add_done_callback(self._background_done)
+
+    def _background_done(self, task: "asyncio.Task[Any]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            # on garde l'ancienne valeur ; le prochain appel retentera
+            print(f"⚠️ Rafraîchissement en arrière-plan échoué : {task.exception()}")
+
+    def needs_refresh(self, age: float, hits: int) -> bool:
+        assert self.ttl is not None
+        if age >= self.ttl:
+            return True
+        return (
+            self.refresh_ahead is not None
+            and age >= self.ttl * self.refresh_ahead
+            and hits >= self.refresh_min_hits
+        )
+
+    async def get(self, args: Any, kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items())))
+        entry = self.cache.get(key)
+        age = 0.0
+        if entry is not None and self.ttl is not None:
+            entry[2] += 1
+            age = time.monotonic() - entry[1]
+            if age >= self.ttl + self.stale_while_revalidate:
+                entry = None  # trop vieille : l'appelant recalcule
+        if entry is None:
+            self.record_miss()
+            return await self.compute(key, args, kwargs)
+        self.record_hit()
+        if self.ttl is not None and self.needs_refresh(age, entry[2]):
+            self.refresh_in_background(key, args, kwargs)
+        return entry[0]
+
+
+@overload
+def memoize_async(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]: ...
+
+
+@overload
+def memoize_async(
+    func: None = None,
+    *,
+    ttl: Optional[float] = None,
+    stale_while_revalidate: float = 0.0,
+    refresh_ahead: Optional[float] = None,
+    refresh_min_hits: int = 1,
+) -> AsyncDecorator: ...
+
+
+def memoize_async(
+    func: Optional[Callable[P, Awaitable[R]]] = None,
+    *,
+    ttl: Optional[float] = None,
+    stale_while_revalidate: float = 0.0,
+    refresh_ahead: Optional[float] = None,
+    refresh_min_hits: int = 1,
+) -> Callable[P, Awaitable[R]] | AsyncDecorator:
     """
     Décorateur async qui met en cache les résultats d'une fonction async.
 
     Le cache est basé sur les arguments passés à la fonction. Les arguments doivent
     être hashables (ex. int, str, tuple). Ce décorateur est particulièrement utile
     pour optimiser des calculs récursifs ou des appels asynchrones répétitifs.
+    Les appels concurrents pour une même clé non encore calculée partagent un seul
+    calcul.
+
+    Sans `ttl`, les valeurs n'expirent jamais. Avec `ttl`, une valeur expirée est :
+      * servie telle quelle pendant `stale_while_revalidate` secondes de plus,
+        pendant qu'une tâche de fond la recalcule ;
+      * recalculée par l'appelant au-delà.
+    Avec `refresh_ahead` (fraction du TTL, ex. 0.8), une clé utilisée au moins
+    `refresh_min_hits` fois depuis son calcul est rafraîchie en arrière-plan avant
+    même d'expirer : les clés chaudes ne provoquent jamais de pic de latence.
+
+    Args:
+        func: Fonction à décorer (utilisation sans parenthèses).
+        ttl (float, optionnel): Durée de vie d'une valeur, en secondes.
+        stale_while_revalidate (float): Durée pendant laquelle une valeur expirée
+            peut encore être servie. Par défaut 0.
+        refresh_ahead (float, optionnel): Fraction du TTL à partir de laquelle une
+            clé populaire est rafraîchie en avance.
+        refresh_min_hits (int): Nombre d'accès qui rend une clé « populaire ». Par défaut 1.
 
     Exemple:
         @memoize_async
         async def fib(n: int) -> int:
             return n if n < 2 else await fib(n - 1) + await fib(n - 2)
+
+        @memoize_async(ttl=60, stale_while_revalidate=30, refresh_ahead=0.8)
+        async def get_config(name: str) -> dict:
+            return await http_get_json(f"/config/{name}")
     """
-    cache: Dict[tuple[Any, ...], R] = {}
 
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # clé basée sur args + kwargs (triés pour être hashables)
-        key = (args, tuple(sorted(kwargs.items())))
-        if key in cache:
-            return cache[key]
-        result = await func(*args, **kwargs)
-        cache[key] = result
-        return result
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        memo = _AsyncMemo(fn, ttl, stale_while_revalidate, refresh_ahead, refresh_min_hits)
+
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return cast(R, await memo.get(args, kwargs))
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+class _AsyncBurst:
+    """Fenêtre de rafale en cours pour une clé de `debounce_async` / `throttle_async`."""
+
+    __slots__ = ("future", "handle", "leading", "args", "kwargs", "pending")
+
+    def __init__(self, future: "asyncio.Future[Any]") -> None:
+        self.future = future
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.leading: Optional["asyncio.Task[Any]"] = None
+        self.args: Any = ()
+        self.kwargs: Any = {}
+        self.pending = False
+
+
+def _chain(task: "asyncio.Task[Any]", future: "asyncio.Future[Any]") -> None:
+    """Recopie le résultat (ou l'exception) de `task` dans `future` à la fin de la tâche."""
+
+    def copy(t: "asyncio.Task[Any]") -> None:
+        if future.done():
+            return
+        if t.cancelled():
+            future.cancel()
+        elif t.exception() is not None:
+            future.set_exception(t.exception())  # type: ignore[arg-type]
+        else:
+            future.set_result(t.result())
+
+    task.add_done_callback(copy)
+
+
+class _AsyncBurstLimiter:
+    """
+    Fusion des rafales d'appels par clé, partagée par `debounce_async` et `throttle_async`.
+
+    `restart=True` (debounce) : la fenêtre repart à chaque appel, elle ne se ferme
+    qu'après `wait` secondes de silence. `restart=False` (throttle) : fenêtre fixe,
+    et l'exécution de fin de fenêtre en ouvre une nouvelle.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        wait: float,
+        leading: bool,
+        trailing: bool,
+        key: Optional[Callable[..., Hashable]],
+        max_keys: int,
+        restart: bool,
+    ) -> None:
+        if not (leading or trailing):
+            raise ValueError("leading et trailing ne peuvent pas être tous les deux False")
+        self.func = func
+        self.wait = wait
+        self.leading = leading
+        self.trailing = trailing
+        self.key = key
+        self.max_keys = max_keys
+        self.restart = restart
+        self.bursts: "OrderedDict[Hashable, _AsyncBurst]" = OrderedDict()
+        self.tasks: set["asyncio.Task[Any]"] = set()
+
+    def _spawn(self, args: Any, kwargs: Any) -> "asyncio.Task[Any]":
+        task = asyncio.ensure_future(self.func(*args, **kwargs))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def _open(self, k: Hashable, loop: asyncio.AbstractEventLoop) -> _AsyncBurst:
+        while len(self.bursts) >= self.max_keys:
+            oldest, burst = self.bursts.popitem(last=False)
+            self._close(oldest, burst)  # mémoire bornée : on exécute la plus ancienne tout de suite
+        burst = _AsyncBurst(loop.create_future())
+        burst.handle = loop.call_later(self.wait, self._close, k, burst)
+        self.bursts[k] = burst
+        return burst
+
+    def _close(self, k: Hashable, burst: _AsyncBurst) -> None:
+        if burst.handle is not None:
+            burst.handle.cancel()
+        if self.bursts.get(k) is burst:
+            del self.bursts[k]
+        if self.trailing and burst.pending:
+            task = self._spawn(burst.args, burst.kwargs)
+            _chain(task, burst.future)
+            if not self.restart:  # throttle : l'exécution de fin ouvre une nouvelle fenêtre
+                self._open(k, asyncio.get_running_loop()).leading = task
+        elif burst.leading is not None:
+            _chain(burst.leading, burst.future)
+        elif not burst.future.done():
+            burst.future.set_result(None)
+
+    async def call(self, args: Any, kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        k = self.key(*args, **kwargs) if self.key is not None else None
+        burst = self.bursts.get(k)
+        if burst is None:
+            burst = self._open(k, loop)
+            if self.leading:
+                burst.leading = self._spawn(args, kwargs)
+                return await asyncio.shield(burst.leading)
+        elif self.restart:
+            assert burst.handle is not None
+            burst.handle.cancel()
+            burst.handle = loop.call_later(self.wait, self._close, k, burst)
+        burst.args, burst.kwargs = args, kwargs
+        burst.pending = True
+        if not self.trailing and burst.leading is not None:
+            return await asyncio.shield(burst.leading)
+        return await asyncio.shield(burst.future)
+
+
+def debounce_async(
+    wait: float,
+    leading: bool = False,
+    trailing: bool = True,
+    key: Optional[Callable[..., Hashable]] = None,
+    max_keys: int = 1024,
+) -> AsyncDecorator:
+    """
+    Décorateur async qui fusionne une rafale d'appels en une seule exécution.
+
+    La rafale se termine après `wait` secondes sans nouvel appel. Avec `trailing`
+    (par défaut), la fonction s'exécute alors une fois, avec les arguments du dernier
+    appel ; avec `leading`, elle s'exécute dès le premier appel de la rafale. Tous les
+    appelants d'une rafale reçoivent le résultat de l'exécution qui les couvre.
+
+    Les rafales sont suivies par clé (`key(*args, **kwargs)`, par défaut une seule
+    clé pour tous les appels) et oubliées dès qu'elles se terminent. Au-delà de
+    `max_keys` rafales simultanées, la plus ancienne est exécutée immédiatement.
+
+    Args:
+        wait (float): Silence (en secondes) qui termine une rafale.
+        leading (bool): Exécute au premier appel de la rafale. Par défaut False.
+        trailing (bool): Exécute à la fin de la rafale. Par défaut True.
+        key (Callable, optionnel): Calcule la clé d'un appel à partir de ses arguments.
+        max_keys (int): Nombre maximum de rafales suivies en même temps. Par défaut 1024.
+
+    Returns:
+        AsyncDecorator: Un décorateur async qui peut être appliqué à une fonction async.
+
+    Exemple:
+        @debounce_async(0.2, key=lambda event: event.path)
+        async def on_file_changed(event) -> None:
+            await reindex(event.path)
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        limiter = _AsyncBurstLimiter(func, wait, leading, trailing, key, max_keys, restart=True)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return cast(R, await limiter.call(args, kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def throttle_async(
+    interval: float,
+    leading: bool = True,
+    trailing: bool = True,
+    key: Optional[Callable[..., Hashable]] = None,
+    max_keys: int = 1024,
+) -> AsyncDecorator:
+    """
+    Décorateur async qui limite une fonction à une exécution par `interval` et par clé.
+
+    Le premier appel s'exécute tout de suite (`leading`) ; les appels suivants dans
+    l'intervalle sont fusionnés en une seule exécution à la fin de l'intervalle
+    (`trailing`), avec les arguments du dernier appel. Chaque appelant reçoit le
+    résultat de l'exécution qui le couvre.
 
-    return wrapper
+    Args:
+        interval (float): Durée minimale entre deux exécutions, en secondes.
+        leading (bool): Exécute au premier appel. Par défaut True.
+        trailing (bool): Exécute à la fin de l'intervalle si des appels ont été
+            fusionnés. Par défaut True.
+        key (Callable, optionnel): Calcule la clé d'un appel à partir de ses arguments.
+        max_keys (int): Nombre maximum de clés suivies en même temps. Par défaut 1024.
+
+    Returns:
+        AsyncDecorator: Un décorateur async qui peut être appliqué à une fonction async.
+
+    Exemple:
+        @throttle_async(1.0, key=lambda payload: payload["repo"])
+        async def on_webhook(payload: dict) -> None:
+            await sync_repo(payload["repo"])
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        limiter = _AsyncBurstLimiter(
+            func, interval, leading, trailing, key, max_keys, restart=False
+        )
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return cast(R, await limiter.call(args, kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def profile_async(
+    sample_rate: float = 0.0,
+    output_dir: str = ".profiles",
+    top: int = 20,
+    sort: str = "cumulative",
+    max_reports: Optional[int] = 100,
+) -> AsyncDecorator:
+    """
+    Décorateur async qui profile une coroutine avec cProfile et écrit ses points chauds.
+
+    Même fonctionnement que `profile` (variable `PYTHON_TOOLS_PROFILE`, `sample_rate`).
+    cProfile mesure le thread entier : les autres tâches qui tournent pendant les
+    `await` de la coroutine apparaissent aussi dans le rapport.
+
+    Args:
+        sample_rate (float): Fraction des appels profilés. Par défaut 0 : rien
+            n'est instrumenté sans `sample_rate` ou la variable d'environnement.
+        output_dir (str): Dossier des rapports. Par défaut ".profiles".
+        top (int): Nombre de fonctions listées. Par défaut 20.
+        sort (str): Clé de tri `pstats`. Par défaut "cumulative".
+        max_reports (int | None): Nombre maximum de rapports écrits par la fonction.
+            Par défaut 100 ; None pour ne pas limiter.
+
+    Returns:
+        AsyncDecorator: Un décorateur async qui peut être appliqué à une fonction async.
+
+    Exemple:
+        @profile_async(sample_rate=0.01)
+        async def handle(request):
+            ...
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        from python_tools_sl.utils.profiling import PROFILE_ENV, profiling, sampler
+
+        sample = sampler(sample_rate, PROFILE_ENV, max_reports)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not sample():
+                return await func(*args, **kwargs)
+            with profiling(func.__qualname__, output_dir, top, sort):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_memory_async(
+    sample_rate: float = 0.0,
+    output_dir: str = ".profiles",
+    top: int = 20,
+    key_type: str = "lineno",
+    max_reports: Optional[int] = 100,
+) -> AsyncDecorator:
+    """
+    Décorateur async qui trace les allocations d'une coroutine avec tracemalloc.
+
+    Même fonctionnement que `trace_memory` (variable `PYTHON_TOOLS_TRACE_MEMORY`,
+    `sample_rate`). tracemalloc est global : les allocations des autres tâches
+    pendant les `await` sont aussi comptées.
+
+    Args:
+        sample_rate (float): Fraction des appels tracés. Par défaut 0 : rien
+            n'est instrumenté sans `sample_rate` ou la variable d'environnement.
+        output_dir (str): Dossier des rapports. Par défaut ".profiles".
+        top (int): Nombre de sites listés. Par défaut 20.
+        key_type (str): Regroupement ("lineno", "filename", "traceback").
+        max_reports (int | None): Nombre maximum de rapports écrits par la fonction.
+            Par défaut 100 ; None pour ne pas limiter.
+
+    Returns:
+        AsyncDecorator: Un décorateur async qui peut être appliqué à une fonction async.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        from python_tools_sl.utils.profiling import TRACE_MEMORY_ENV, memory_tracing, sampler
+
+        sample = sampler(sample_rate, TRACE_MEMORY_ENV, max_reports)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not sample():
+                return await func(*args, **kwargs)
+            with memory_tracing(func.__qualname__, output_dir, top, key_type):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 if __name__ == "__main__":
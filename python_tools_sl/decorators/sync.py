@@ -1,10 +1,22 @@
+import contextvars
+import threading
 import time
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Tuple, Type
-
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type, cast
+
+from python_tools_sl.utils.deadline import (
+    DeadlineExceeded,
+    check_deadline,
+    deadline,
+    remaining_time,
+)
 from python_tools_sl.utils.formatting import format_duration
 from python_tools_sl.utils.typing_helpers import Decorator, P, R
 
+# Les métriques, le profilage sont importés par chaque décorateur
+# au moment de la décoration : importer ce module ne charge que ce qu'il utilise.
+
 
 def with_pause(seconds: int | float = 2, message: Optional[str] = None) -> Decorator:
     """
@@ -29,11 +41,16 @@ def with_pause(seconds: int | float = 2, message: Optional[str] = None) -> Decor
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        from python_tools_sl.metrics.instruments import PAUSE_SECONDS, function_label, record
+
+        label = function_label(func)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             result = func(*args, **kwargs)
             print(message or f"⏸️ Pause de {seconds}s pour éviter les timeouts...")
             time.sleep(seconds)
+            record(PAUSE_SECONDS, label, seconds)
             return result
 
         return wrapper
@@ -63,12 +80,17 @@ def timeit(prefix: str = "[TIMEIT]") -> Decorator:
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        from python_tools_sl.metrics.instruments import TIMEIT_SECONDS, function_label, record
+
+        label = function_label(func)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start = time.perf_counter()
             result = func(*args, **kwargs)
             end = time.perf_counter()
             print(f"{prefix} {func.__name__} exécutée en {format_duration(end - start)}")
+            record(TIMEIT_SECONDS, label, end - start)
             return result
 
         return wrapper
@@ -84,6 +106,10 @@ def retry(
     """
     Décorateur qui réessaie l'exécution d'une fonction en cas d'exception.
 
+    Si une deadline est active (voir `timeout` et `python_tools_sl.utils.deadline`),
+    aucun nouvel essai n'est tenté lorsqu'elle tomberait pendant le délai d'attente :
+    la dernière exception est levée tout de suite.
+
     Args:
         max_attempts (int): Nombre maximum de tentatives (par défaut 3).
         delay (float): Délai en secondes entre deux tentatives (par défaut 1.0).
@@ -102,18 +128,34 @@ def retry(
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        from python_tools_sl.metrics.instruments import (
+            RETRY_ATTEMPTS,
+            RETRY_FAILURES,
+            RETRY_GIVEUPS,
+            function_label,
+            record,
+        )
+
+        label = function_label(func)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             last_exc = None
             for attempt in range(1, max_attempts + 1):
+                record(RETRY_ATTEMPTS, label)
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exc = e
+                    record(RETRY_FAILURES, label)
                     print(f"⚠️ Tentative {attempt}/{max_attempts} échouée : {e}")
                     if attempt < max_attempts:
+                        remaining = remaining_time()
+                        if remaining is not None and remaining <= delay:
+                            break  # la deadline tombera avant le prochain essai
                         time.sleep(delay)
             if last_exc is not None:
+                record(RETRY_GIVEUPS, label)
                 raise last_exc
             raise RuntimeError("Échec du retry: aucune exception capturée")
 
@@ -135,13 +177,23 @@ def memoize(func: Callable[P, R]) -> Callable[P, R]:
             return n if n < 2 else fib(n-1) + fib(n-2)
     """
     cache: Dict[tuple[Any, ...], R] = {}
+    from python_tools_sl.metrics.instruments import (
+        MEMOIZE_HITS,
+        MEMOIZE_MISSES,
+        function_label,
+        record,
+    )
+
+    label = function_label(func)
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         # clé basée sur args + kwargs (triés pour être hashables)
         key = (args, tuple(sorted(kwargs.items())))
         if key in cache:
+            record(MEMOIZE_HITS, label)
             return cache[key]
+        record(MEMOIZE_MISSES, label)
         result = func(*args, **kwargs)
         cache[key] = result
         return result
@@ -149,6 +201,361 @@ def memoize(func: Callable[P, R]) -> Callable[P, R]:
     return wrapper
 
 
+def timeout(seconds: Optional[float] = None) -> Decorator:
+    """
+    Décorateur qui borne la durée d'une fonction synchrone.
+
+    La fonction s'exécute dans un thread dédié (avec une copie du contexte
+    `contextvars`) et l'appelant attend au plus `seconds`, ou moins si une deadline
+    englobante (`deadline`, `timeout` parent) expire avant. Le budget est propagé aux
+    appels imbriqués : les `timeout` et `retry` internes le respectent.
+
+    Attention : un thread ne peut pas être interrompu. En cas de dépassement,
+    l'appelant reçoit `DeadlineExceeded` mais le thread finit son travail en
+    arrière-plan (il est `daemon` et ne bloque pas l'arrêt du programme).
+
+    Args:
+        seconds (float, optionnel): Durée maximale en secondes. None : seule la
+            deadline englobante s'applique.
+
+    Returns:
+        Decorator: Un décorateur qui peut être appliqué à une fonction.
+
+    Raises:
+        DeadlineExceeded: Si la fonction n'a pas terminé à temps (sous-classe de
+            `TimeoutError`).
+
+    Exemple:
+        @timeout(2.0)
+        def fetch(url: str) -> str:
+            return http_get(url)
+    """
+    from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with deadline(seconds):
+                limit = remaining_time()
+                if limit is None:
+                    return func(*args, **kwargs)
+                check_deadline()
+                ctx = contextvars.copy_context()
+                future: Future[R] = Future()
+
+                def run() -> None:
+                    try:
+                        future.set_result(ctx.run(func, *args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+
+                threading.Thread(target=run, name=f"timeout-{func.__name__}", daemon=True).start()
+                try:
+                    return future.result(timeout=limit)
+                except FutureTimeoutError:
+                    if future.done():
+                        raise
+                    raise DeadlineExceeded(
+                        f"{func.__name__} n'a pas terminé en {format_duration(limit)}"
+                    ) from None
+
+        return wrapper
+
+    return decorator
+
+
+class _SyncBurst:
+    """Fenêtre de rafale en cours pour une clé de `debounce` / `throttle`."""
+
+    __slots__ = ("timer", "deadline", "args", "kwargs", "pending")
+
+    def __init__(self) -> None:
+        self.timer: Optional[threading.Timer] = None
+        self.deadline = 0.0  # fin de fenêtre (time.monotonic())
+        self.args: Any = ()
+        self.kwargs: Any = {}
+        self.pending = False
+
+
+class _SyncBurstLimiter:
+    """
+    Fusion des rafales d'appels par clé, partagée par `debounce` et `throttle`.
+
+    Les exécutions de fin de rafale ont lieu dans un thread `threading.Timer` ;
+    `restart=True` (debounce) repousse la fin de fenêtre à chaque appel, `restart=False`
+    (throttle) garde une fenêtre fixe. Un appel ne fait que déplacer `deadline` :
+    c'est le minuteur qui, à son échéance, se réarme pour le temps restant. Une
+    rafale de centaines d'appels ne crée donc qu'un thread par période `wait`.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        wait: float,
+        leading: bool,
+        trailing: bool,
+        key: Optional[Callable[..., Hashable]],
+        max_keys: int,
+        restart: bool,
+    ) -> None:
+        if not (leading or trailing):
+            raise ValueError("leading et trailing ne peuvent pas être tous les deux False")
+        self.func = func
+        self.wait = wait
+        self.leading = leading
+        self.trailing = trailing
+        self.key = key
+        self.max_keys = max_keys
+        self.restart = restart
+        self.bursts: "OrderedDict[Hashable, _SyncBurst]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _arm(self, k: Hashable, burst: _SyncBurst, delay: float) -> None:
+        """Fixe la fin de fenêtre à `delay` et lance le minuteur (sous `self.lock`)."""
+        burst.deadline = time.monotonic() + delay
+        self._schedule(k, burst, delay)
+
+    def _schedule(self, k: Hashable, burst: _SyncBurst, delay: float) -> None:
+        if burst.timer is not None:
+            burst.timer.cancel()
+        burst.timer = threading.Timer(delay, self._expire, (k, burst))
+        burst.timer.daemon = True
+        burst.timer.start()
+
+    def _open(self, k: Hashable) -> _SyncBurst:
+        """Ouvre une fenêtre pour `k` (à appeler sous `self.lock`)."""
+        while len(self.bursts) >= self.max_keys:
+            # mémoire bornée : la plus ancienne rafale est close tout de suite
+            oldest, old = self.bursts.popitem(last=False)
+            self._arm(oldest, old, 0)
+        burst = _SyncBurst()
+        self.bursts[k] = burst
+        self._arm(k, burst, self.wait)
+        return burst
+
+    def _expire(self, k: Hashable, burst: _SyncBurst) -> None:
+        with self.lock:
+            remaining = burst.deadline - time.monotonic()
+            if remaining > 0:  # fenêtre repoussée depuis l'armement : on se réarme
+                self._schedule(k, burst, remaining)
+                return
+            if self.bursts.get(k) is burst:
+                del self.bursts[k]
+            run = self.trailing and burst.pending
+            burst.pending = False
+            if run and not self.restart:  # throttle : l'exécution de fin ouvre une fenêtre
+                self._open(k)
+        if run:
+            self.func(*burst.args, **burst.kwargs)
+
+    def call(self, args: Any, kwargs: Any) -> Any:
+        k = self.key(*args, **kwargs) if self.key is not None else None
+        with self.lock:
+            burst = self.bursts.get(k)
+            run_now = burst is None and self.leading
+            if burst is None:
+                burst = self._open(k)
+            elif self.restart:
+                burst.deadline = time.monotonic() + self.wait
+            if not run_now:
+                burst.args, burst.kwargs = args, kwargs
+                burst.pending = True
+        if run_now:
+            return self.func(*args, **kwargs)
+        return None
+
+
+def debounce(
+    wait: float,
+    leading: bool = False,
+    trailing: bool = True,
+    key: Optional[Callable[..., Hashable]] = None,
+    max_keys: int = 1024,
+) -> Callable[[Callable[P, R]], Callable[P, Optional[R]]]:
+    """
+    Décorateur qui fusionne une rafale d'appels en une seule exécution.
+
+    Version synchrone de `debounce_async` : la rafale se termine après `wait`
+    secondes sans nouvel appel, et la fonction s'exécute alors une fois (`trailing`)
+    avec les arguments du dernier appel, dans un thread `threading.Timer`. Avec
+    `leading`, le premier appel de la rafale s'exécute directement.
+
+    L'appel retourne le résultat quand la fonction s'est exécutée dans l'appelant
+    (`leading`), sinon None : le résultat d'une exécution différée est perdu.
+
+    Args:
+        wait (float): Silence (en secondes) qui termine une rafale.
+        leading (bool): Exécute au premier appel de la rafale. Par défaut False.
+        trailing (bool): Exécute à la fin de la rafale. Par défaut True.
+        key (Callable, optionnel): Calcule la clé d'un appel à partir de ses arguments.
+        max_keys (int): Nombre maximum de rafales suivies en même temps ; au-delà,
+            la plus ancienne est exécutée immédiatement. Par défaut 1024.
+
+    Returns:
+        Un décorateur qui peut être appliqué à une fonction.
+
+    Exemple:
+        @debounce(0.2, key=lambda path: path)
+        def on_file_changed(path: str) -> None:
+            reindex(path)
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, Optional[R]]:
+        limiter = _SyncBurstLimiter(func, wait, leading, trailing, key, max_keys, restart=True)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Optional[R]:
+            return cast(Optional[R], limiter.call(args, kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def throttle(
+    interval: float,
+    leading: bool = True,
+    trailing: bool = True,
+    key: Optional[Callable[..., Hashable]] = None,
+    max_keys: int = 1024,
+) -> Callable[[Callable[P, R]], Callable[P, Optional[R]]]:
+    """
+    Décorateur qui limite une fonction à une exécution par `interval` et par clé.
+
+    Version synchrone de `throttle_async` : le premier appel s'exécute directement
+    (`leading`), les suivants dans l'intervalle sont fusionnés en une exécution en
+    fin d'intervalle (`trailing`, dans un thread `threading.Timer`). L'appel retourne
+    le résultat quand la fonction s'est exécutée dans l'appelant, sinon None.
+
+    Args:
+        interval (float): Durée minimale entre deux exécutions, en secondes.
+        leading (bool): Exécute au premier appel. Par défaut True.
+        trailing (bool): Exécute en fin d'intervalle si des appels ont été fusionnés.
+            Par défaut True.
+        key (Callable, optionnel): Calcule la clé d'un appel à partir de ses arguments.
+        max_keys (int): Nombre maximum de clés suivies en même temps. Par défaut 1024.
+
+    Returns:
+        Un décorateur qui peut être appliqué à une fonction.
+
+    Exemple:
+        @throttle(1.0)
+        def refresh_dashboard() -> None:
+            redraw()
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, Optional[R]]:
+        limiter = _SyncBurstLimiter(func, interval, leading, trailing, key, max_keys, restart=False)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Optional[R]:
+            return cast(Optional[R], limiter.call(args, kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def profile(
+    sample_rate: float = 0.0,
+    output_dir: str = ".profiles",
+    top: int = 20,
+    sort: str = "cumulative",
+    max_reports: Optional[int] = 100,
+) -> Decorator:
+    """
+    Décorateur qui profile une fonction avec cProfile et écrit ses points chauds.
+
+    Chaque appel retenu produit un `.prof` et un rapport texte des `top` fonctions
+    dans `output_dir` (voir `python_tools_sl.utils.profiling.profiling`).
+    La variable d'environnement `PYTHON_TOOLS_PROFILE` force l'activation ("1") ou
+    la désactivation ("0") ; sinon, une fraction `sample_rate` des appels est profilée.
+
+    Args:
+        sample_rate (float): Fraction des appels profilés. Par défaut 0 : rien
+            n'est instrumenté sans `sample_rate` ou la variable d'environnement.
+        output_dir (str): Dossier des rapports. Par défaut ".profiles".
+        top (int): Nombre de fonctions listées. Par défaut 20.
+        sort (str): Clé de tri `pstats`. Par défaut "cumulative".
+        max_reports (int | None): Nombre maximum de rapports écrits par la fonction.
+            Par défaut 100 ; None pour ne pas limiter.
+
+    Returns:
+        Decorator: Un décorateur qui peut être appliqué à une fonction.
+
+    Exemple:
+        @profile(sample_rate=0.01)  # 1 appel sur 100
+        def handle(request):
+            ...
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        from python_tools_sl.utils.profiling import PROFILE_ENV, profiling, sampler
+
+        sample = sampler(sample_rate, PROFILE_ENV, max_reports)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not sample():
+                return func(*args, **kwargs)
+            with profiling(func.__qualname__, output_dir, top, sort):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_memory(
+    sample_rate: float = 0.0,
+    output_dir: str = ".profiles",
+    top: int = 20,
+    key_type: str = "lineno",
+    max_reports: Optional[int] = 100,
+) -> Decorator:
+    """
+    Décorateur qui trace les allocations d'une fonction avec tracemalloc.
+
+    Chaque appel retenu écrit les `top` sites d'allocation et le pic mémoire dans
+    `output_dir` (voir `python_tools_sl.utils.profiling.memory_tracing`).
+    La variable d'environnement `PYTHON_TOOLS_TRACE_MEMORY` force l'activation ("1")
+    ou la désactivation ("0") ; sinon, une fraction `sample_rate` des appels est tracée.
+
+    Args:
+        sample_rate (float): Fraction des appels tracés. Par défaut 0 : rien
+            n'est instrumenté sans `sample_rate` ou la variable d'environnement.
+        output_dir (str): Dossier des rapports. Par défaut ".profiles".
+        top (int): Nombre de sites listés. Par défaut 20.
+        key_type (str): Regroupement ("lineno", "filename", "traceback").
+        max_reports (int | None): Nombre maximum de rapports écrits par la fonction.
+            Par défaut 100 ; None pour ne pas limiter.
+
+    Returns:
+        Decorator: Un décorateur qui peut être appliqué à une fonction.
+
+    Exemple:
+        @trace_memory(top=10)  # actif avec PYTHON_TOOLS_TRACE_MEMORY=1
+        def load(path):
+            ...
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        from python_tools_sl.utils.profiling import TRACE_MEMORY_ENV, memory_tracing, sampler
+
+        sample = sampler(sample_rate, TRACE_MEMORY_ENV, max_reports)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not sample():
+                return func(*args, **kwargs)
+            with memory_tracing(func.__qualname__, output_dir, top, key_type):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 if __name__ == "__main__":
     # TIMEIT
     @timeit()
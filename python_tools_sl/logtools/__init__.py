@@ -1,5 +1,38 @@
-from .config import setup_logging
-from .context import log_section
-from .decorators import log_call
+from typing import TYPE_CHECKING
 
-__all__ = ["setup_logging", "log_call", "log_section"]
+from python_tools_sl.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import setup_logging, shutdown_logging
+    from .context import log_section
+    from .decorators import log_call
+    from .formatters import JsonFormatter
+    from .tracing import ChromeTraceExporter, Span, add_span_exporter, remove_span_exporter
+
+__all__ = [
+    "setup_logging",
+    "shutdown_logging",
+    "log_call",
+    "log_section",
+    "JsonFormatter",
+    "Span",
+    "ChromeTraceExporter",
+    "add_span_exporter",
+    "remove_span_exporter",
+]
+
+if not TYPE_CHECKING:  # type checkers only see the imports above
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "setup_logging": ".config",
+            "shutdown_logging": ".config",
+            "log_call": ".decorators",
+            "log_section": ".context",
+            "JsonFormatter": ".formatters",
+            "Span": ".tracing",
+            "ChromeTraceExporter": ".tracing",
+            "add_span_exporter": ".tracing",
+            "remove_span_exporter": ".tracing",
+        },
+    )
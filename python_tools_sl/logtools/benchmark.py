@@ -0,0 +1,48 @@
+"""Benchmark: records/second of the text formatter vs `JsonFormatter`.
+
+Usage:
+    python -m python_tools_sl.logtools.benchmark [n_records]
+"""
+
+import io
+import logging
+import sys
+import time
+
+from .config import LOG_FORMAT
+from .formatters import HAS_ORJSON, JsonFormatter
+
+
+def _records(n: int) -> list[logging.LogRecord]:
+    records = []
+    for i in range(n):
+        record = logging.LogRecord(
+            "bench", logging.INFO, __file__, 1, "request %s done in %.3fs", (i, 0.123), None
+        )
+        record.user_id = i
+        record.path = "/api/items"
+        records.append(record)
+    return records
+
+
+def bench_formatter(formatter: logging.Formatter, n: int = 100_000) -> float:
+    """Return how many records per second `formatter` writes to an in-memory stream."""
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(formatter)
+    records = _records(n)
+    start = time.perf_counter()
+    for record in records:
+        handler.emit(record)
+    return n / (time.perf_counter() - start)
+
+
+def main(n: int = 100_000) -> None:
+    text = bench_formatter(logging.Formatter(LOG_FORMAT), n)
+    encoder = "orjson" if HAS_ORJSON else "json"
+    as_json = bench_formatter(JsonFormatter(), n)
+    print(f"text formatter          : {text:>12,.0f} records/s")
+    print(f"json formatter ({encoder:<7}): {as_json:>12,.0f} records/s ({as_json / text:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
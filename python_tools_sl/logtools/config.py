@@ -1,18 +1,228 @@
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+from typing import Literal, Optional
+
+LOG_FORMAT = "[%(levelname)s] %(asctime)s - %(message)s"
+
+_listener: Optional["BatchingQueueListener"] = None
+
+
+class _DeferredFlushMixin:
+    """Make a stream handler skip the flush done after every record.
+
+    The stream stays buffered and is only flushed by `force_flush` (called by the
+    listener once per batch) or when the handler is closed.
+    """
+
+    def flush(self) -> None:
+        pass
+
+    def force_flush(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+
+class BufferedFileHandler(_DeferredFlushMixin, logging.FileHandler):
+    """FileHandler whose writes are flushed per batch instead of per record."""
+
+
+class BufferedRotatingFileHandler(_DeferredFlushMixin, logging.handlers.RotatingFileHandler):
+    """Size-based rotating file handler flushed per batch."""
+
+
+class BufferedTimedRotatingFileHandler(
+    _DeferredFlushMixin, logging.handlers.TimedRotatingFileHandler
+):
+    """Time-based rotating file handler flushed per batch."""
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that drains records in batches and flushes handlers once per batch.
+
+    The background thread blocks until a record arrives, then pulls up to
+    `batch_size` more without waiting, hands them all to the handlers and flushes
+    once. Under load this turns one write syscall per record into one per batch;
+    when idle, every record is still flushed as soon as it has been handled.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def flush(self) -> None:
+        """Flush every handler, including the ones deferring their flushes."""
+        for handler in self.handlers:
+            if isinstance(handler, _DeferredFlushMixin):
+                handler.force_flush()
+            else:
+                handler.flush()
+
+    def _monitor(self) -> None:
+        task_done = getattr(self.queue, "task_done", None)
+        stop = False
+        while not stop:
+            try:
+                batch: list[Optional[logging.LogRecord]] = [self.dequeue(True)]
+            except queue.Empty:  # pragma: no cover
+                break
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is None:  # sentinel enqueued by stop()
+                    stop = True
+                else:
+                    self.handle(record)
+                if task_done is not None:
+                    task_done()
+            self.flush()
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback and stack out of the message.
+
+    The stock `prepare()` formats the record, merging the traceback into `msg`
+    and clearing `exc_info`/`exc_text`, which formatters on the listener side
+    (e.g. `JsonFormatter`) can then no longer report separately. Here only the
+    message arguments are merged; the traceback is rendered into `exc_text` and
+    `stack_info` is kept, so the listener's handlers format them as usual.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None  # traceback objects keep frames alive and do not pickle
+        return record
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+def _file_handler(
+    filename: str, max_bytes: int, when: Optional[str], backup_count: int, buffered: bool
+) -> logging.Handler:
+    if when is not None:
+        cls = (
+            BufferedTimedRotatingFileHandler
+            if buffered
+            else logging.handlers.TimedRotatingFileHandler
+        )
+        return cls(filename, when=when, backupCount=backup_count, encoding="utf-8")
+    if max_bytes > 0:
+        rcls = BufferedRotatingFileHandler if buffered else logging.handlers.RotatingFileHandler
+        return rcls(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    return (BufferedFileHandler if buffered else logging.FileHandler)(filename, encoding="utf-8")
+
+
+def shutdown_logging() -> None:
+    """Stop the background listener started by `setup_logging(use_queue=True)`.
+
+    Pending records are written and every handler is flushed and closed.
+    Safe to call several times; queue mode also registers it with `atexit`.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+            handler.close()
+    listener.stop()
+    listener.flush()
+    for handler in listener.handlers:
+        handler.close()
 
 
 def setup_logging(
-    level: str = "INFO", to_file: bool = False, to_console: bool = True, filename: str = "app.log"
-) -> None:
-    """Configure global logging."""
+    level: str = "INFO",
+    to_file: bool = False,
+    to_console: bool = True,
+    filename: str = "app.log",
+    use_queue: bool = False,
+    max_bytes: int = 0,
+    when: Optional[str] = None,
+    backup_count: int = 5,
+    batch_size: int = 256,
+    log_format: Literal["text", "json"] = "text",
+) -> Optional[logging.handlers.QueueListener]:
+    """Configure global logging.
+
+    By default handlers are attached directly to the root logger. With
+    `use_queue=True`, the root logger only gets a `QueueHandler`: records are
+    written by a background `BatchingQueueListener` thread with buffered,
+    batch-flushed file writes, so slow I/O never blocks the logging call.
+
+    Args:
+        level (str): Root logger level. Defaults to "INFO".
+        to_file (bool): Write records to `filename`. Defaults to False.
+        to_console (bool): Write records to stderr. Defaults to True.
+        filename (str): Log file path. Defaults to "app.log".
+        use_queue (bool): Send records through a queue to a background thread.
+            Defaults to False.
+        max_bytes (int): Rotate the file once it reaches this size (0 disables).
+        when (str, optional): Rotate the file on a time basis instead
+            (`TimedRotatingFileHandler` values: "S", "M", "H", "D", "midnight"...).
+        backup_count (int): Number of rotated files to keep. Defaults to 5.
+        batch_size (int): Maximum number of records written between two flushes
+            in queue mode. Defaults to 256.
+        log_format (str): "text" (default) or "json" for one JSON object per line
+            (see `JsonFormatter`).
+
+    Returns:
+        QueueListener | None: The running listener in queue mode, otherwise None.
+    """
+    shutdown_logging()
+
     handlers: list[logging.Handler] = []
     if to_console:
         handlers.append(logging.StreamHandler())
     if to_file:
-        handlers.append(logging.FileHandler(filename, encoding="utf-8"))
+        handlers.append(_file_handler(filename, max_bytes, when, backup_count, use_queue))
 
+    formatter: logging.Formatter = logging.Formatter(LOG_FORMAT)
+    if log_format == "json":
+        from .formatters import JsonFormatter  # json / orjson are only loaded when used
+
+        formatter = JsonFormatter()
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if not use_queue:
+        logging.basicConfig(
+            level=getattr(logging, level.upper(), logging.INFO),
+            format=LOG_FORMAT,
+            handlers=handlers,
+        )
+        return None
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = BatchingQueueListener(log_queue, *handlers, batch_size=batch_size)
     logging.basicConfig(
         level=getattr(logging, level.upper(), logging.INFO),
-        format="[%(levelname)s] %(asctime)s - %(message)s",
-        handlers=handlers,
+        handlers=[StructuredQueueHandler(log_queue)],
+        force=True,
     )
+    listener.start()
+    # registered here rather than at import time, so importing the module has no side effect
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+    global _listener
+    _listener = listener
+    return listener
@@ -1,13 +1,67 @@
 import logging
-from contextlib import contextmanager
-from typing import Generator
-
-
-@contextmanager
-def log_section(name: str) -> Generator[None, None, None]:
-    """Context manager to log entry/exit of a section."""
-    logging.info(">>> Entering section: %s", name)
-    try:
-        yield
-    finally:
-        logging.info("<<< Exiting section: %s", name)
+from contextvars import Token
+from types import TracebackType
+from typing import Any, Optional, Type
+
+from python_tools_sl.utils.formatting import format_duration
+
+from .tracing import Span, end_span, start_span
+
+
+class log_section:
+    """Context manager (sync and async) logging a section as a timed tracing span.
+
+    Each section gets a span id and the id of the enclosing section (tracked
+    with `contextvars`, so nesting is right across threads and asyncio tasks).
+    Finished spans go to the exporters registered with `add_span_exporter`.
+
+    Args:
+        name (str): Section name.
+        level (int): Logging level of the entry/exit messages. Defaults to INFO.
+        **attributes: Extra values attached to the span.
+
+    Example:
+        with log_section("scraping"):
+            async with log_section("fetch", url=url):
+                ...
+    """
+
+    def __init__(self, name: str, level: int = logging.INFO, **attributes: Any) -> None:
+        self.name = name
+        self.level = level
+        self.attributes = attributes
+        self.span: Optional[Span] = None
+        self._token: Optional[Token[Optional[Span]]] = None
+
+    def __enter__(self) -> Span:
+        self.span, self._token = start_span(self.name, **self.attributes)
+        logging.log(self.level, ">>> Entering section: %s", self.name)
+        return self.span
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        assert self.span is not None and self._token is not None
+        if exc_type is not None:
+            self.span.attributes["error"] = exc_type.__name__
+        end_span(self.span, self._token)
+        logging.log(
+            self.level,
+            "<<< Exiting section: %s (%s)",
+            self.name,
+            format_duration(self.span.duration),
+        )
+
+    async def __aenter__(self) -> Span:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.__exit__(exc_type, exc, tb)
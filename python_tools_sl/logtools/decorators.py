@@ -1,18 +1,158 @@
 import logging
+import reprlib
+import time
 from functools import wraps
-from typing import Callable
+from typing import Any, Awaitable, Callable, Optional, cast, overload
 
-from python_tools_sl.utils.typing_helpers import P, R
+from python_tools_sl.utils.formatting import format_duration
+from python_tools_sl.utils.typing_helpers import Decorator, P, R
 
 
-def log_call(func: Callable[P, R]) -> Callable[P, R]:
-    """Decorator to log function calls and return values."""
+def _make_repr(max_repr: int) -> Callable[[Any], str]:
+    """Build a repr function whose output never exceeds `max_repr` characters."""
+    limiter = reprlib.Repr()
+    limiter.maxstring = max_repr
+    limiter.maxother = max_repr
+    limiter.maxlong = max_repr
 
-    @wraps(func)
+    def short_repr(value: Any) -> str:
+        text = limiter.repr(value)
+        return text if len(text) <= max_repr else text[: max_repr - 3] + "..."
+
+    return short_repr
+
+
+class _CallLogger:
+    """Level gating, sampling and message formatting shared by the `log_call` wrappers."""
+
+    def __init__(
+        self, name: str, level: int, logger: logging.Logger, max_repr: int, sample_rate: float
+    ) -> None:
+        self.name = name
+        self.level = level
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.short_repr = _make_repr(max_repr)
+        # random is only imported when calls are actually sampled
+        self.random: Optional[Callable[[], float]] = None
+        if sample_rate < 1.0:
+            import random
+
+            self.random = random.random
+
+    def enabled(self) -> bool:
+        if not self.logger.isEnabledFor(self.level):
+            return False
+        return self.random is None or self.random() < self.sample_rate
+
+    def enter(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> float:
+        self.logger.log(
+            self.level,
+            "Calling %s with args=(%s) kwargs={%s}",
+            self.name,
+            ", ".join(self.short_repr(a) for a in args),
+            ", ".join(f"{k!r}: {self.short_repr(v)}" for k, v in kwargs.items()),
+        )
+        return time.perf_counter()
+
+    def exit(self, result: Any, start: float) -> None:
+        elapsed = format_duration(time.perf_counter() - start)
+        self.logger.log(
+            self.level, "%s returned %s in %s", self.name, self.short_repr(result), elapsed
+        )
+
+    def error(self, exc: BaseException, start: float) -> None:
+        elapsed = format_duration(time.perf_counter() - start)
+        self.logger.log(
+            self.level, "%s raised %s after %s", self.name, self.short_repr(exc), elapsed
+        )
+
+
+def _wrap_sync(fn: Callable[P, R], call_logger: _CallLogger) -> Callable[P, R]:
+    @wraps(fn)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        logging.debug("Calling %s with args=%s kwargs=%s", func.__name__, args, kwargs)
-        result = func(*args, **kwargs)
-        logging.debug("%s returned %s", func.__name__, result)
+        if not call_logger.enabled():
+            return fn(*args, **kwargs)
+        start = call_logger.enter(args, kwargs)
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            call_logger.error(e, start)
+            raise
+        call_logger.exit(result, start)
         return result
 
     return wrapper
+
+
+def _wrap_async(
+    fn: Callable[P, Awaitable[R]], call_logger: _CallLogger
+) -> Callable[P, Awaitable[R]]:
+    @wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not call_logger.enabled():
+            return await fn(*args, **kwargs)
+        start = call_logger.enter(args, kwargs)
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as e:
+            call_logger.error(e, start)
+            raise
+        call_logger.exit(result, start)
+        return result
+
+    return wrapper
+
+
+@overload
+def log_call(func: Callable[P, R]) -> Callable[P, R]: ...
+
+
+@overload
+def log_call(
+    func: None = None,
+    *,
+    level: int = logging.DEBUG,
+    logger: Optional[logging.Logger] = None,
+    max_repr: int = 200,
+    sample_rate: float = 1.0,
+) -> Decorator: ...
+
+
+def log_call(
+    func: Optional[Callable[P, R]] = None,
+    *,
+    level: int = logging.DEBUG,
+    logger: Optional[logging.Logger] = None,
+    max_repr: int = 200,
+    sample_rate: float = 1.0,
+) -> Callable[P, R] | Decorator:
+    """Decorator to log function calls, return values and durations.
+
+    Usable bare (`@log_call`) or with options (`@log_call(max_repr=80)`).
+    When `level` is disabled on the logger, or the call is not sampled, the
+    wrapped function is called directly: no argument repr, no timing.
+    Coroutine functions are awaited, so the logged value is the real result.
+
+    Args:
+        func: Function to decorate (when used bare).
+        level (int): Logging level of the messages. Defaults to DEBUG.
+        logger (logging.Logger, optional): Target logger. Defaults to the root logger.
+        max_repr (int): Maximum length of each argument / return value repr.
+        sample_rate (float): Fraction of calls logged, between 0 and 1. Defaults to 1.
+    """
+
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        import inspect  # deferred: inspect pulls in ast and dis
+
+        call_logger = _CallLogger(
+            fn.__qualname__, level, logger or logging.getLogger(), max_repr, sample_rate
+        )
+        if inspect.iscoroutinefunction(fn):
+            afn = cast(Callable[P, Awaitable[Any]], fn)
+            return cast(Callable[P, R], _wrap_async(afn, call_logger))
+        return _wrap_sync(fn, call_logger)
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -5,8 +5,7 @@ from .context import log_section
 from .decorators import log_call
 
 # from outside :just do : from logging import setup_logging, log_call, log_section
-
-setup_logging(level="DEBUG")
+# run with: python -m python_tools_sl.logtools.examples
 
 
 @log_call
@@ -14,5 +13,11 @@ def add(a: Any, b: Any) -> Any:
     return a + b
 
 
-with log_section("Demo ADD"):
-    add(2, 3)
+def main() -> None:
+    setup_logging(level="DEBUG")
+    with log_section("Demo ADD"):
+        add(2, 3)
+
+
+if __name__ == "__main__":
+    main()
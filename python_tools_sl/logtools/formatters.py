@@ -0,0 +1,80 @@
+import json
+import logging
+import time
+from typing import Any, Callable, Optional
+
+try:  # optional, much faster than the json module
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
+# Attributes set by LogRecord itself: anything else comes from `extra=`.
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys() | {"message", "asctime"}
+)
+
+
+def _default(value: Any) -> str:
+    return str(value)
+
+
+def _json_dumps() -> Callable[[dict[str, Any]], str]:
+    """Return the fastest available `dict -> str` JSON encoder."""
+    if HAS_ORJSON:
+        dumps = orjson.dumps
+        option = orjson.OPT_NON_STR_KEYS
+
+        def orjson_dumps(payload: dict[str, Any]) -> str:
+            return dumps(payload, default=_default, option=option).decode()
+
+        return orjson_dumps
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+    return encoder.encode
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter writing one JSON object per record (JSON lines).
+
+    Keys always come in the same order: `timestamp` (UTC, ISO 8601, ms),
+    `level`, `logger`, `message`, then the `extra=` fields, then `exc_info` and
+    `stack_info` when present. `orjson` is used when installed, otherwise a
+    pre-built compact `json.JSONEncoder`.
+    """
+
+    def __init__(self, dumps: Optional[Callable[[dict[str, Any]], str]] = None) -> None:
+        super().__init__()
+        self._dumps = dumps or _json_dumps()
+        # (second, prefix) replaced as one tuple: handlers sharing the formatter
+        # each hold their own lock, so two threads may format concurrently
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            # the prefix only changes once per second: cache it
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "timestamp": self._timestamp(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            payload["exc_info"] = record.exc_text
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return self._dumps(payload)
@@ -0,0 +1,148 @@
+import itertools
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Optional, Protocol
+
+_span_ids = itertools.count(1)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("logtools_current_span", default=None)
+
+_task_tracks: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+_task_track_ids = itertools.count(1_000_000)
+
+
+def _track_id() -> int:
+    """Return the trace "thread" of the caller: its asyncio task if any, else its thread.
+
+    Concurrent tasks share a thread but their spans overlap, so each task gets
+    its own track for the viewer to nest spans correctly. `asyncio` is only
+    looked up if already imported: without it, no task can be running.
+    """
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            track = _task_tracks.get(task)
+            if track is None:
+                track = _task_tracks[task] = next(_task_track_ids)
+            return track
+    return threading.get_ident()
+
+
+class SpanExporter(Protocol):
+    """Anything receiving finished spans."""
+
+    def export(self, span: "Span") -> None: ...
+
+
+@dataclass
+class Span:
+    """A timed section, linked to its parent through `contextvars`.
+
+    Times come from `time.perf_counter_ns()` (monotonic) and are in nanoseconds.
+    """
+
+    name: str
+    span_id: int = field(default_factory=lambda: next(_span_ids))
+    parent_id: Optional[int] = None
+    start_ns: int = 0
+    end_ns: int = 0
+    track_id: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is running)."""
+        return max(self.end_ns - self.start_ns, 0) / 1e9
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost running span of the current context, if any."""
+    return _current_span.get()
+
+
+def start_span(name: str, **attributes: Any) -> tuple[Span, Token[Optional[Span]]]:
+    """Open a span as a child of the current one and make it current."""
+    parent = _current_span.get()
+    span = Span(
+        name,
+        parent_id=parent.span_id if parent is not None else None,
+        track_id=_track_id(),
+        attributes=attributes,
+    )
+    token = _current_span.set(span)
+    span.start_ns = time.perf_counter_ns()
+    return span, token
+
+
+def end_span(span: Span, token: Token[Optional[Span]]) -> None:
+    """Close `span`, restore its parent as current span and export it."""
+    span.end_ns = time.perf_counter_ns()
+    _current_span.reset(token)
+    for exporter in _exporters:
+        exporter.export(span)
+
+
+_exporters: list[SpanExporter] = []
+
+
+def add_span_exporter(exporter: SpanExporter) -> None:
+    """Send every finished span to `exporter`."""
+    _exporters.append(exporter)
+
+
+def remove_span_exporter(exporter: SpanExporter) -> None:
+    """Stop sending spans to `exporter`."""
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+class ChromeTraceExporter:
+    """Collect spans and write them in the Chrome Trace Event format.
+
+    The file (`{"traceEvents": [...]}`) opens in Perfetto (ui.perfetto.dev) and
+    chrome://tracing. Each span is a complete ("X") event on the track of its
+    thread or asyncio task. Events are kept in memory until `write()`.
+
+    Args:
+        path (str | os.PathLike): Output file.
+        max_events (int): Spans kept at most; older ones are dropped. 0 means no limit.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_events: int = 0) -> None:
+        self.path = path
+        self._events: deque[dict[str, Any]] = deque(maxlen=max_events or None)
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def export(self, span: Span) -> None:
+        args: dict[str, Any] = {"span_id": span.span_id, "parent_id": span.parent_id}
+        args.update(span.attributes)
+        event = {
+            "name": span.name,
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": (span.end_ns - span.start_ns) / 1000,
+            "pid": self._pid,
+            "tid": span.track_id,
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def write(self) -> None:
+        """Write the collected spans to `path`."""
+        import json  # only needed when a trace is actually written
+
+        with self._lock:
+            events = list(self._events)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
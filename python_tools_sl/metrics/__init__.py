@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING
+
+from python_tools_sl.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .exporter import render_openmetrics, start_metrics_server
+    from .registry import (
+        REGISTRY,
+        Counter,
+        Gauge,
+        Histogram,
+        Registry,
+        enable_metrics,
+        metrics_enabled,
+    )
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "enable_metrics",
+    "metrics_enabled",
+    "render_openmetrics",
+    "start_metrics_server",
+]
+
+# l'exporteur (http.server) n'est chargé que si l'on exporte
+_EXPORTER = ("render_openmetrics", "start_metrics_server")
+
+if not TYPE_CHECKING:  # mypy ne voit que les imports ci-dessus
+    __getattr__, __dir__ = lazy_exports(
+        __name__, {name: ".exporter" if name in _EXPORTER else ".registry" for name in __all__}
+    )
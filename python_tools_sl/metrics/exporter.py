@@ -0,0 +1,88 @@
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from .registry import REGISTRY, Registry
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render_openmetrics(registry: Registry = REGISTRY) -> str:
+    """
+    Rend toutes les métriques du registre au format texte OpenMetrics.
+
+    Args:
+        registry (Registry): Registre à exporter. Par défaut le registre global.
+
+    Returns:
+        str: Le texte OpenMetrics, terminé par `# EOF`.
+    """
+    lines: List[str] = []
+    for metric in sorted(registry.collect(), key=lambda m: m.name):
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+        for suffix, key, value in metric.samples():
+            labels = [f'{n}="{_escape(v)}"' for n, v in zip(metric.labelnames, key)]
+            if suffix.startswith("_bucket:"):
+                suffix, bound = suffix.split(":", 1)
+                labels.append(f'le="{bound}"')
+            label_text = "{" + ",".join(labels) + "}" if labels else ""
+            lines.append(f"{metric.name}{suffix}{label_text} {_format_value(value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(
+    port: int = 9464, addr: str = "127.0.0.1", registry: Registry = REGISTRY
+) -> ThreadingHTTPServer:
+    """
+    Sert `/metrics` au format OpenMetrics dans un thread d'arrière-plan.
+
+    Args:
+        port (int): Port d'écoute (0 : port libre choisi par le système). Par défaut 9464.
+        addr (str): Adresse d'écoute. Par défaut "127.0.0.1" (local uniquement).
+        registry (Registry): Registre exporté. Par défaut le registre global.
+
+    Returns:
+        ThreadingHTTPServer: Le serveur démarré (`shutdown()` pour l'arrêter).
+
+    Exemple:
+        >>> server = start_metrics_server(port=0)
+        >>> server.server_address
+        ('127.0.0.1', 54321)
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render_openmetrics(registry).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,47 @@
+"""Métriques alimentées par `python_tools_sl.decorators` quand `metrics_enabled()`."""
+
+from typing import Any, Callable
+
+from .registry import REGISTRY, Counter, Histogram, metrics_enabled
+
+
+def function_label(func: Callable[..., Any]) -> str:
+    """Valeur du label `function` : `module.qualname` de la fonction décorée."""
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None) or repr(func)
+    return f"{module}.{name}" if module else name
+
+
+MEMOIZE_HITS = REGISTRY.counter(
+    "python_tools_memoize_hits", "Appels servis par le cache de memoize", ["function"]
+)
+MEMOIZE_MISSES = REGISTRY.counter(
+    "python_tools_memoize_misses", "Appels calculés par memoize (absents du cache)", ["function"]
+)
+RETRY_ATTEMPTS = REGISTRY.counter(
+    "python_tools_retry_attempts", "Tentatives exécutées par retry", ["function"]
+)
+RETRY_FAILURES = REGISTRY.counter(
+    "python_tools_retry_failures",
+    "Tentatives échouées (exception capturée) par retry",
+    ["function"],
+)
+RETRY_GIVEUPS = REGISTRY.counter(
+    "python_tools_retry_giveups", "Appels abandonnés par retry après le dernier échec", ["function"]
+)
+TIMEIT_SECONDS = REGISTRY.histogram(
+    "python_tools_timeit_seconds", "Durée des appels mesurés par timeit", ["function"]
+)
+PAUSE_SECONDS = REGISTRY.counter(
+    "python_tools_pause_seconds", "Temps passé à dormir dans with_pause", ["function"]
+)
+
+
+def record(metric: Counter | Histogram, label: str, value: float = 1.0) -> None:
+    """Incrémente (compteur) ou observe (histogramme) `value`, si les métriques sont actives."""
+    if not metrics_enabled():
+        return
+    if isinstance(metric, Histogram):
+        metric.observe(value, function=label)
+    else:
+        metric.inc(value, function=label)
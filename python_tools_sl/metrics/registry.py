@@ -0,0 +1,215 @@
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+METRICS_ENV = "PYTHON_TOOLS_METRICS"
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# mêmes valeurs que `parse_bool`, sans charger `parsing` (json, datetime) à l'import
+_enabled = os.environ.get(METRICS_ENV, "0").strip().lower() in ("true", "yes", "1", "on")
+
+
+def metrics_enabled() -> bool:
+    """True si les décorateurs doivent alimenter le registre (coût : une lecture de global)."""
+    return _enabled
+
+
+def enable_metrics(enabled: bool = True) -> None:
+    """Active (ou désactive) l'instrumentation des décorateurs.
+
+    Par défaut, l'état initial vient de la variable d'environnement `PYTHON_TOOLS_METRICS`.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+class _Metric(ABC):
+    """Base commune : nom, aide, noms de labels et verrou très court par métrique."""
+
+    type_name = "unknown"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        try:
+            key = tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            key = ()
+        if len(key) != len(labels) or len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} attend les labels {self.labelnames}, reçu {labels}")
+        return key
+
+    @abstractmethod
+    def samples(self) -> Iterator[Tuple[str, LabelValues, float]]:
+        """Échantillons `(suffixe, valeurs de labels, valeur)` pour l'export."""
+
+
+class Counter(_Metric):
+    """Compteur monotone (exporté avec le suffixe `_total`)."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("un compteur ne peut pas décroître")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[Tuple[str, LabelValues, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "_total", key, value
+
+
+class Gauge(_Metric):
+    """Valeur instantanée qui peut monter ou descendre."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[Tuple[str, LabelValues, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", key, value
+
+
+class Histogram(_Metric):
+    """Distribution de valeurs (durées...) par seaux cumulés, avec somme et nombre."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # valeurs de labels -> [compte par seau (non cumulé)..., somme]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        if math.isnan(value):
+            raise ValueError(f"{self.name} : NaN ne peut pas être observé")
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 1)
+            row[index] += 1
+            row[-1] += value
+
+    def count(self, **labels: str) -> float:
+        row = self._values.get(self._key(labels))
+        return sum(row[:-1]) if row else 0.0
+
+    def samples(self) -> Iterator[Tuple[str, LabelValues, float]]:
+        with self._lock:
+            items = [(key, list(row)) for key, row in self._values.items()]
+        for key, row in items:
+            cumulative = 0.0
+            for bound, n in zip(self.buckets, row):
+                cumulative += n
+                yield f"_bucket:{_format_bound(bound)}", key, cumulative
+            yield "_count", key, cumulative
+            yield "_sum", key, row[-1]
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+class Registry:
+    """Ensemble de métriques nommées ; `counter`/`gauge`/`histogram` créent ou retrouvent."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: object, **kwargs: object) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"la métrique {name} existe déjà avec un autre type")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def collect(self) -> List[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+
+#: Registre par défaut, alimenté par les décorateurs.
+REGISTRY = Registry()
@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING
+
+from python_tools_sl.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import CacheEntry, ResponseCache
+    from .client import (
+        DEFAULT_HEADERS,
+        HttpClient,
+        HttpStatusError,
+        Response,
+        close_client,
+        fetch,
+        get_client,
+    )
+
+__all__ = [
+    "DEFAULT_HEADERS",
+    "CacheEntry",
+    "HttpClient",
+    "HttpStatusError",
+    "Response",
+    "ResponseCache",
+    "close_client",
+    "fetch",
+    "get_client",
+]
+
+if not TYPE_CHECKING:  # mypy ne voit que les imports ci-dessus
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            name: ".cache" if name in ("CacheEntry", "ResponseCache") else ".client"
+            for name in __all__
+        },
+    )
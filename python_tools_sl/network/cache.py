@@ -0,0 +1,383 @@
+import asyncio
+import calendar
+import contextlib
+import dataclasses
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_tz
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from .client import Response
+
+
+def get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Lit un en-tête sans tenir compte de la casse."""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def parse_cache_control(value: Optional[str]) -> dict[str, Optional[str]]:
+    """
+    Découpe un en-tête `Cache-Control` en directives.
+
+    Exemple:
+        >>> parse_cache_control('max-age=60, no-cache, private')
+        {'max-age': '60', 'no-cache': None, 'private': None}
+    """
+    directives: dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _delta_seconds(value: Optional[str]) -> float:
+    """Durée en secondes (`max-age`, `Age`) ; 0 si absente, invalide ou négative."""
+    try:
+        seconds = float(value or 0)
+    except ValueError:
+        return 0.0
+    return seconds if math.isfinite(seconds) and seconds > 0 else 0.0
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    parsed = parsedate_tz(value) if value else None
+    if parsed is None:
+        return None
+    return float(calendar.timegm(parsed[:9]) - (parsed[9] or 0))
+
+
+@dataclass
+class CacheEntry:
+    """
+    Réponse stockée en cache avec ses informations de fraîcheur.
+
+    Attributes:
+        response (Response): Réponse complète (statut, en-têtes, corps).
+        stored_at (float): Date (epoch) de stockage ou de la dernière revalidation.
+        max_age (float | None): Durée de fraîcheur en secondes, None si inconnue.
+        initial_age (float): Âge annoncé par le serveur (`Age`) au stockage.
+        no_cache (bool): Revalidation obligatoire à chaque utilisation.
+        vary (dict[str, str]): Valeurs des en-têtes de requête listés dans `Vary`
+            (nom en minuscules -> valeur, "" si absent) lors du stockage.
+    """
+
+    response: Response
+    stored_at: float
+    max_age: Optional[float]
+    initial_age: float = 0.0
+    no_cache: bool = False
+    vary: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_response(
+        cls,
+        response: Response,
+        now: Optional[float] = None,
+        request_headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional["CacheEntry"]:
+        """Construit une entrée, ou None si la réponse ne doit pas être stockée.
+
+        `request_headers` sont les en-têtes envoyés : ceux que la réponse liste
+        dans `Vary` sont mémorisés pour que `matches` refuse une autre variante.
+        """
+        if response.status != 200:
+            return None
+        cc = parse_cache_control(get_header(response.headers, "Cache-Control"))
+        vary_names = [n.strip() for n in (get_header(response.headers, "Vary") or "").split(",")]
+        if "no-store" in cc or "*" in vary_names:
+            return None
+        now = time.time() if now is None else now
+        max_age: Optional[float] = None
+        if cc.get("max-age") is not None:
+            max_age = _delta_seconds(cc["max-age"])
+        else:
+            expires = _http_date(get_header(response.headers, "Expires"))
+            if expires is not None:
+                date = _http_date(get_header(response.headers, "Date")) or now
+                max_age = max(expires - date, 0.0)
+        entry = cls(
+            response=response,
+            stored_at=now,
+            max_age=max_age,
+            initial_age=_delta_seconds(get_header(response.headers, "Age")),
+            no_cache="no-cache" in cc,
+            vary={
+                name.lower(): get_header(request_headers or {}, name) or ""
+                for name in vary_names
+                if name
+            },
+        )
+        if max_age is None and not entry.has_validators:
+            return None  # ni durée de fraîcheur ni moyen de revalider
+        return entry
+
+    @property
+    def etag(self) -> Optional[str]:
+        return get_header(self.response.headers, "ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return get_header(self.response.headers, "Last-Modified")
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def age(self, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return self.initial_age + max(now - self.stored_at, 0.0)
+
+    def matches(self, request_headers: Mapping[str, str]) -> bool:
+        """True si la requête envoie les mêmes valeurs pour les en-têtes de `Vary`."""
+        return all(
+            (get_header(request_headers, name) or "") == value for name, value in self.vary.items()
+        )
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """True si la réponse peut être servie sans contacter le serveur."""
+        if self.no_cache or self.max_age is None:
+            return False
+        return self.age(now) < self.max_age
+
+    def conditional_headers(self) -> dict[str, str]:
+        """En-têtes `If-None-Match` / `If-Modified-Since` pour une revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self, not_modified: Response, now: Optional[float] = None) -> "CacheEntry":
+        """Nouvelle entrée après une réponse 304 : corps conservé, en-têtes mis à jour."""
+        headers = dict(self.response.headers)
+        for key, value in not_modified.headers.items():
+            if key.lower() in ("content-length", "content-encoding", "transfer-encoding"):
+                continue
+            for old in [k for k in headers if k.lower() == key.lower()]:
+                del headers[old]
+            headers[key] = value
+        response = dataclasses.replace(self.response, headers=headers)
+        entry = CacheEntry.from_response(response, now)
+        if entry is None:
+            return dataclasses.replace(
+                self, response=response, stored_at=time.time() if now is None else now
+            )
+        return dataclasses.replace(entry, vary=self.vary)
+
+
+class ResponseCache:
+    """
+    Cache de réponses HTTP à deux niveaux : LRU en mémoire puis disque.
+
+    Une entrée trouvée sur disque est remontée dans le LRU mémoire. Les écritures
+    disque sont atomiques (fichier temporaire puis `os.replace`), ce qui permet à
+    plusieurs processus de partager le même dossier. Quand le dossier dépasse
+    `max_disk_bytes`, les entrées les moins récemment utilisées sont supprimées
+    jusqu'à 90 % de la limite.
+
+    Depuis une coroutine, utiliser `get_async` / `set_async` / `delete_async` : le
+    niveau disque y est lu et écrit dans un thread, sans bloquer la boucle.
+
+    Args:
+        max_entries (int): Nombre maximum d'entrées en mémoire. Par défaut 256.
+        directory (str | os.PathLike, optionnel): Dossier du cache disque.
+            Sans dossier, seul le niveau mémoire est utilisé.
+        max_disk_bytes (int): Taille maximale du cache disque. Par défaut 256 Mio.
+
+    Exemple:
+        cache = ResponseCache(max_entries=1000, directory=".http_cache")
+        async with HttpClient(cache=cache) as client:
+            page = await client.fetch(url)  # 2e appel : lecture locale ou 304
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        directory: Optional[str | os.PathLike[str]] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None  # taille estimée, recalculée à l'éviction
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Retourne l'entrée de `key` (mémoire puis disque), ou None."""
+        entry = self._recall(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    async def get_async(self, key: str) -> Optional[CacheEntry]:
+        """Comme `get`, avec la lecture disque faite hors de la boucle d'événements."""
+        entry = self._recall(key)
+        if entry is None and self.directory is not None:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stocke `entry` dans les deux niveaux."""
+        self._remember(key, entry)
+        self._dump(key, entry)
+
+    async def set_async(self, key: str, entry: CacheEntry) -> None:
+        """Comme `set`, avec l'écriture disque faite hors de la boucle d'événements."""
+        self._remember(key, entry)
+        if self.directory is not None:
+            await asyncio.to_thread(self._dump, key, entry)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.directory is not None:
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+
+    async def delete_async(self, key: str) -> None:
+        """Comme `delete`, avec la suppression disque faite hors de la boucle d'événements."""
+        if self.directory is None:
+            self.delete(key)
+        else:
+            await asyncio.to_thread(self.delete, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.meta.json"):
+                path.unlink(missing_ok=True)
+            for path in self.directory.glob("*.body"):
+                path.unlink(missing_ok=True)
+
+    def _recall(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        assert self.directory is not None
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}.meta.json", self.directory / f"{name}.body"
+
+    def _dump(self, key: str, entry: CacheEntry) -> None:
+        if self.directory is None:
+            return
+        meta_path, body_path = self._paths(key)
+        meta: dict[str, Any] = {
+            "key": key,
+            "url": entry.response.url,
+            "status": entry.response.status,
+            "headers": dict(entry.response.headers),
+            "encoding": entry.response.encoding,
+            "stored_at": entry.stored_at,
+            "max_age": entry.max_age,
+            "initial_age": entry.initial_age,
+            "no_cache": entry.no_cache,
+            "vary": entry.vary,
+        }
+        data = json.dumps(meta).encode()
+        # corps d'abord : une méta présente garantit un corps complet
+        _atomic_write(body_path, entry.response.body)
+        _atomic_write(meta_path, data)
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._evict_disk()
+            else:
+                self._disk_bytes += len(entry.response.body) + len(data)
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Mesure le dossier et supprime les entrées les plus anciennes si besoin."""
+        assert self.directory is not None
+        files = []
+        for meta_path in self.directory.glob("*.meta.json"):
+            body_path = meta_path.with_name(meta_path.name[: -len(".meta.json")] + ".body")
+            try:
+                body_stat = body_path.stat()
+                size = meta_path.stat().st_size + body_stat.st_size
+            except OSError:
+                continue
+            files.append((body_stat.st_mtime, size, meta_path, body_path))
+        total = sum(size for _, size, _, _ in files)
+        if total > self.max_disk_bytes:
+            files.sort(key=lambda f: f[0])  # dernière utilisation (mtime du corps)
+            for _, size, meta_path, body_path in files:
+                if total <= self.max_disk_bytes * 0.9:
+                    break
+                meta_path.unlink(missing_ok=True)  # méta d'abord : l'entrée disparaît d'un coup
+                body_path.unlink(missing_ok=True)
+                total -= size
+        self._disk_bytes = total
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        if self.directory is None:
+            return None
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_bytes())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("key") != key:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(body_path)  # marque l'entrée comme récemment utilisée (éviction LRU)
+        response = Response(
+            url=meta["url"],
+            status=meta["status"],
+            headers=meta["headers"],
+            body=body,
+            encoding=meta["encoding"],
+        )
+        return CacheEntry(
+            response=response,
+            stored_at=meta["stored_at"],
+            max_age=meta["max_age"],
+            initial_age=meta["initial_age"],
+            no_cache=meta["no_cache"],
+            vary=meta.get("vary", {}),
+        )
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,289 @@
+import asyncio
+import dataclasses
+import json
+import weakref
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+try:
+    import aiohttp
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "python_tools_sl.network nécessite aiohttp : pip install 'python-tools-sl[network]'"
+    ) from e
+
+from python_tools_sl.decorators.async_ import retry_async
+from python_tools_sl.utils.deadline import bounded, check_deadline
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+
+DEFAULT_HEADERS: dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) python-tools-sl",
+    "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+}
+
+RETRY_STATUSES: Tuple[int, ...] = (429, 502, 503, 504)
+
+
+class HttpStatusError(Exception):
+    """Réponse HTTP dont le statut déclenche un nouvel essai (voir `retry_statuses`)."""
+
+    def __init__(self, url: str, status: int) -> None:
+        super().__init__(f"HTTP {status} pour {url}")
+        self.url = url
+        self.status = status
+
+
+@dataclass
+class Response:
+    """Réponse HTTP entièrement lue (la connexion est déjà rendue au pool).
+
+    `from_cache` vaut True si le corps vient du cache (frais ou revalidé par un 304).
+    """
+
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    body: bytes = field(repr=False)
+    encoding: str = "utf-8"
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class HttpClient:
+    """
+    Client HTTP async avec pool de connexions keep-alive partagé.
+
+    Toutes les requêtes d'un client passent par une seule `aiohttp.ClientSession` :
+    les connexions TCP/TLS sont réutilisées d'une page à l'autre au lieu d'être
+    rouvertes à chaque fetch. Le connecteur borne le nombre de connexions au total
+    et par hôte, ce qui sert aussi de limite de concurrence par hôte.
+
+    Les erreurs réseau, les timeouts et les statuts de `retry_statuses` sont
+    réessayés via `retry_async`. Sous une deadline (`python_tools_sl.utils.deadline`),
+    le timeout de chaque tentative est borné par le temps restant.
+
+    Args:
+        limit (int): Nombre maximum de connexions ouvertes. Par défaut 100.
+        limit_per_host (int): Nombre maximum de connexions simultanées par hôte.
+            Par défaut 8.
+        timeout (float): Timeout total d'une tentative, en secondes. Par défaut 30.
+        connect_timeout (float): Timeout d'établissement de connexion. Par défaut 10.
+        headers (Mapping[str, str], optionnel): En-têtes ajoutés à `DEFAULT_HEADERS`.
+        max_attempts (int): Nombre maximum de tentatives par requête. Par défaut 3.
+        retry_delay (float): Délai entre deux tentatives. Par défaut 1.0.
+        retry_statuses (Tuple[int, ...]): Statuts HTTP réessayés.
+        keepalive_timeout (float): Durée de vie d'une connexion inactive. Par défaut 30.
+        cache (ResponseCache, optionnel): Cache des réponses GET, avec revalidation
+            conditionnelle (`ETag` / `Last-Modified`) et respect de `Vary`. Les requêtes
+            authentifiées (`Authorization`, `auth=`) ne passent pas par le cache.
+            Par défaut aucun cache.
+
+    Exemple:
+        async with HttpClient(limit_per_host=4) as client:
+            pages = await client.fetch_many(urls)
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        timeout: float = 30.0,
+        connect_timeout: float = 10.0,
+        headers: Optional[Mapping[str, str]] = None,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+        keepalive_timeout: float = 30.0,
+        cache: Optional["ResponseCache"] = None,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.retry_statuses = retry_statuses
+        self.keepalive_timeout = keepalive_timeout
+        self.cache = cache
+        self._session: Optional[aiohttp.ClientSession] = None
+        retry_exceptions: Tuple[Type[Exception], ...] = (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            HttpStatusError,
+        )
+        self._request: Callable[..., Awaitable[Response]] = retry_async(
+            max_attempts=max_attempts, delay=retry_delay, exceptions=retry_exceptions
+        )(self._request_once)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Session partagée, créée au premier appel dans la boucle courante."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout, headers=self.headers
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Ferme la session et toutes les connexions du pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _request_once(self, method: str, url: str, **kwargs: Any) -> Response:
+        check_deadline()
+        limit = bounded(self.timeout.total)
+        if limit != self.timeout.total and "timeout" not in kwargs:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=limit, connect=self.timeout.connect)
+        async with self.session.request(method, url, **kwargs) as resp:
+            if resp.status in self.retry_statuses:
+                raise HttpStatusError(url, resp.status)
+            body = await resp.read()
+            return Response(
+                url=str(resp.url),
+                status=resp.status,
+                headers=dict(resp.headers),
+                body=body,
+                encoding=resp.charset or "utf-8",
+            )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """
+        Envoie une requête HTTP et lit toute la réponse.
+
+        Args:
+            method (str): Méthode HTTP ("GET", "POST"...).
+            url (str): URL cible.
+            **kwargs: Arguments transmis à `aiohttp.ClientSession.request`
+                (`headers`, `params`, `json`, `data`, `timeout`...).
+
+        Returns:
+            Response: La réponse lue.
+
+        Raises:
+            HttpStatusError: Si le statut est toujours dans `retry_statuses`
+                après la dernière tentative.
+        """
+        if self.cache is None or method.upper() != "GET":
+            return await self._request(method, url, **kwargs)
+        return await self._cached_get(self.cache, url, **kwargs)
+
+    async def _cached_get(self, cache: "ResponseCache", url: str, **kwargs: Any) -> Response:
+        from .cache import CacheEntry, get_header
+
+        request_headers = {**self.headers, **(kwargs.get("headers") or {})}
+        if kwargs.get("auth") is not None or get_header(request_headers, "Authorization"):
+            # réponse propre à un utilisateur : jamais servie à d'autres identifiants
+            return await self._request("GET", url, **kwargs)
+
+        params = kwargs.get("params")
+        key = f"{url} {sorted(dict(params).items())}" if params else url
+        entry = await cache.get_async(key)
+        if entry is not None and not entry.matches(request_headers):
+            entry = None  # autre variante (`Vary`) : elle sera remplacée par la réponse
+        if entry is not None:
+            if entry.is_fresh():
+                return dataclasses.replace(entry.response, from_cache=True)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.conditional_headers()}
+
+        response = await self._request("GET", url, **kwargs)
+        if response.status == 304 and entry is not None:
+            entry = entry.revalidated(response)
+            await cache.set_async(key, entry)
+            return dataclasses.replace(entry.response, from_cache=True)
+
+        new_entry = CacheEntry.from_response(response, request_headers=request_headers)
+        if new_entry is not None:
+            await cache.set_async(key, new_entry)
+        elif entry is not None:
+            await cache.delete_async(key)
+        return response
+
+    async def fetch(self, url: str, **kwargs: Any) -> Response:
+        """Raccourci pour `request("GET", url, ...)`."""
+        return await self.request("GET", url, **kwargs)
+
+    async def fetch_text(self, url: str, **kwargs: Any) -> str:
+        """Télécharge `url` et retourne le corps décodé."""
+        return (await self.fetch(url, **kwargs)).text
+
+    async def fetch_many(
+        self, urls: Iterable[str], return_exceptions: bool = False, **kwargs: Any
+    ) -> list[Any]:
+        """
+        Télécharge plusieurs URLs en parallèle sur le pool partagé.
+
+        La concurrence effective est bornée par `limit` et `limit_per_host`.
+
+        Args:
+            urls (Iterable[str]): URLs à télécharger.
+            return_exceptions (bool): Retourne les exceptions au lieu de les lever,
+                comme `asyncio.gather`. Par défaut False.
+
+        Returns:
+            list: Les `Response` (ou exceptions), dans l'ordre des URLs.
+        """
+        return await asyncio.gather(
+            *(self.fetch(url, **kwargs) for url in urls), return_exceptions=return_exceptions
+        )
+
+
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HttpClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client() -> HttpClient:
+    """
+    Retourne le client partagé de la boucle d'événements courante.
+
+    Une session aiohttp est liée à sa boucle : un client est donc créé par boucle,
+    puis réutilisé par tous les appels de cette boucle.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None:
+        client = _shared_clients[loop] = HttpClient()
+    return client
+
+
+async def close_client() -> None:
+    """Ferme le client partagé de la boucle courante (à appeler avant la fin de la boucle)."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+async def fetch(url: str, **kwargs: Any) -> Response:
+    """Télécharge `url` avec le client partagé de la boucle courante."""
+    return await get_client().fetch(url, **kwargs)
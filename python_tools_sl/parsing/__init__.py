@@ -1,9 +1,17 @@
-from python_tools_sl.parsing.parsers import (
-    is_json_type,
-    parse_bool,
-    parse_date,
-    parse_json_safe,
-    slugify,
-)
+from typing import TYPE_CHECKING
+
+from python_tools_sl.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from python_tools_sl.parsing.parsers import (
+        is_json_type,
+        parse_bool,
+        parse_date,
+        parse_json_safe,
+        slugify,
+    )
 
 __all__ = ["is_json_type", "parse_json_safe", "parse_date", "parse_bool", "slugify"]
+
+if not TYPE_CHECKING:  # mypy ne voit que les imports ci-dessus
+    __getattr__, __dir__ = lazy_exports(__name__, dict.fromkeys(__all__, ".parsers"))
@@ -0,0 +1,103 @@
+"""Plugin pytest : budget de débit partagé entre workers pytest-xdist.
+
+Chargé automatiquement à l'installation du paquet (entry point `pytest11`).
+
+Un test marqué `@pytest.mark.rate_limited` attend son créneau avant de s'exécuter.
+Le budget est stocké dans un fichier verrouillé commun à tous les workers xdist :
+`pytest -n 8` respecte donc le même débit global qu'une exécution en série,
+tout en parallélisant le reste du travail.
+
+Configuration (ligne de commande > pytest.ini > défaut) :
+    --rate-budget=RATE           / rate_budget = 1.0        appels par seconde
+    --rate-budget-burst=BURST    / rate_budget_burst = 1    rafale autorisée
+
+Exemple:
+    @pytest.mark.rate_limited("x.com", rate=0.5)  # 1 test toutes les 2 s, tous workers confondus
+    def test_make_soup_twitter():
+        ...
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
+
+from python_tools_sl.parsing.parsers import slugify
+from python_tools_sl.utils.rate_budget import FileRateBudget
+
+BudgetFactory = Callable[..., FileRateBudget]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("rate-budget", "budget de débit partagé (python-tools-sl)")
+    group.addoption(
+        "--rate-budget",
+        type=float,
+        default=None,
+        help="appels par seconde autorisés pour les tests rate_limited (tous workers confondus)",
+    )
+    group.addoption(
+        "--rate-budget-burst",
+        type=int,
+        default=None,
+        help="nombre de tests rate_limited pouvant démarrer sans attendre",
+    )
+    parser.addini("rate_budget", "appels par seconde par défaut", default="1.0")
+    parser.addini("rate_budget_burst", "rafale par défaut", default="1")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "rate_limited(key='default', rate=None, burst=None): attend un créneau du budget "
+        "de débit partagé `key` avant le test",
+    )
+
+
+def _shared_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.getbasetemp()
+    # sous xdist, chaque worker a son basetemp (popen-gwN) dans un dossier commun au run
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent
+    return root / "rate-budgets"
+
+
+@pytest.fixture(scope="session")
+def rate_budget_factory(
+    pytestconfig: pytest.Config, tmp_path_factory: pytest.TempPathFactory
+) -> BudgetFactory:
+    """Fabrique de `FileRateBudget` partagés par clé entre tous les workers du run."""
+    default_rate = pytestconfig.getoption("rate_budget") or float(
+        pytestconfig.getini("rate_budget")
+    )
+    default_burst = pytestconfig.getoption("rate_budget_burst") or int(
+        pytestconfig.getini("rate_budget_burst")
+    )
+    directory = _shared_dir(tmp_path_factory)
+
+    def factory(
+        key: str = "default", rate: Optional[float] = None, burst: Optional[int] = None
+    ) -> FileRateBudget:
+        return FileRateBudget(
+            directory / f"{slugify(key) or 'default'}.json",
+            rate=rate or default_rate,
+            burst=burst or default_burst,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def rate_budget(rate_budget_factory: BudgetFactory) -> FileRateBudget:
+    """Budget partagé par défaut, pour espacer des appels à l'intérieur d'un test."""
+    return rate_budget_factory()
+
+
+@pytest.fixture(autouse=True)
+def _rate_limited_marker(request: pytest.FixtureRequest) -> None:
+    marker = request.node.get_closest_marker("rate_limited")
+    if marker is None:
+        return
+    factory: BudgetFactory = request.getfixturevalue("rate_budget_factory")
+    factory(*marker.args, **marker.kwargs).acquire()
@@ -0,0 +1,72 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("python_tools_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Le budget de temps (deadline) de l'appel en cours est épuisé."""
+
+
+def get_deadline() -> Optional[float]:
+    """Retourne la deadline courante (horloge `time.monotonic()`), ou None."""
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Retourne le temps restant avant la deadline courante, en secondes.
+
+    Returns:
+        float | None: Temps restant (0 si dépassée), ou None s'il n'y a pas de deadline.
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+    return max(current - time.monotonic(), 0.0)
+
+
+def bounded(seconds: Optional[float]) -> Optional[float]:
+    """Retourne `seconds` borné par le temps restant (None si ni l'un ni l'autre)."""
+    remaining = remaining_time()
+    if remaining is None:
+        return seconds
+    return remaining if seconds is None else min(seconds, remaining)
+
+
+def check_deadline() -> None:
+    """Lève `DeadlineExceeded` si la deadline courante est dépassée."""
+    if remaining_time() == 0.0:
+        raise DeadlineExceeded("deadline dépassée")
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Fixe un budget de temps pour le bloc et tous les appels qu'il contient.
+
+    La deadline est stockée dans une `ContextVar` : elle suit les appels imbriqués,
+    les tâches asyncio créées dans le bloc et les threads lancés par `timeout`.
+    Une deadline imbriquée ne peut que raccourcir celle qui l'englobe.
+
+    Args:
+        seconds (float | None): Budget en secondes. None garde la deadline existante.
+
+    Yields:
+        float | None: La deadline effective (horloge `time.monotonic()`).
+
+    Exemple:
+        >>> with deadline(2.0):
+        ...     fetch_all()  # les @timeout / @retry imbriqués respectent les 2 s
+    """
+    current = _deadline.get()
+    if seconds is not None:
+        candidate = time.monotonic() + seconds
+        current = candidate if current is None else min(current, candidate)
+    token = _deadline.set(current)
+    try:
+        yield current
+    finally:
+        _deadline.reset(token)
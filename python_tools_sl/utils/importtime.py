@@ -0,0 +1,174 @@
+"""Benchmark du coût d'import des paquets publics (`python -X importtime`).
+
+Chaque instruction de `TARGETS` est exécutée dans un interpréteur neuf ; le coût
+retenu est la somme des temps « self » de tous les modules importés (minimum sur
+plusieurs exécutions) et le nombre de ces modules, démarrage de l'interpréteur
+déduit. Le résultat est comparé au budget enregistré : la commande échoue (code 1)
+si un import devient plus cher, et (code 2) si le budget est absent ou a été
+mesuré sous une autre version de Python.
+
+Usage:
+    python -m python_tools_sl.utils.importtime            # compare au budget
+    python -m python_tools_sl.utils.importtime --update   # réécrit le budget
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_BUDGET = "importtime_budget.json"
+
+#: Nom -> instruction mesurée (le chemin d'import réel des utilisateurs).
+TARGETS: Dict[str, str] = {
+    "packages": (
+        "import python_tools_sl.decorators, python_tools_sl.logtools, python_tools_sl.metrics,"
+        " python_tools_sl.network, python_tools_sl.parsing"
+    ),
+    "decorators.sync": "from python_tools_sl.decorators import memoize, retry, timeit",
+    "decorators.async": "from python_tools_sl.decorators import memoize_async, retry_async",
+    "logtools": "from python_tools_sl.logtools import setup_logging, log_call, log_section",
+    "metrics": "from python_tools_sl.metrics import enable_metrics",
+    "parsing": "from python_tools_sl.parsing import parse_bool, slugify",
+}
+
+
+@dataclass
+class ImportCost:
+    """Coût d'une instruction d'import : microsecondes et nombre de modules chargés."""
+
+    us: int
+    modules: int
+
+
+def parse_importtime(stderr: str) -> ImportCost:
+    """
+    Additionne les lignes `import time: self | cumulative | module` de `-X importtime`.
+
+    Exemple:
+        >>> parse_importtime("import time:       120 |        300 | json")
+        ImportCost(us=120, modules=1)
+    """
+    total = modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us = line.split(":", 1)[1].split("|", 1)[0].strip()
+        if self_us.isdigit():
+            total += int(self_us)
+            modules += 1
+    return ImportCost(us=total, modules=modules)
+
+
+def measure(statement: str, runs: int = 5) -> ImportCost:
+    """Mesure `statement` dans `runs` interpréteurs neufs et garde le moins cher."""
+    costs = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        costs.append(parse_importtime(proc.stderr))
+    return ImportCost(us=min(c.us for c in costs), modules=min(c.modules for c in costs))
+
+
+def measure_all(runs: int = 5) -> Dict[str, ImportCost]:
+    """Mesure toutes les `TARGETS`, coût d'un interpréteur vide (`pass`) déduit."""
+    base = measure("pass", runs)
+    costs = {}
+    for name, statement in TARGETS.items():
+        cost = measure(statement, runs)
+        costs[name] = ImportCost(max(cost.us - base.us, 0), cost.modules - base.modules)
+    return costs
+
+
+def compare(
+    budget: Dict[str, ImportCost],
+    measured: Dict[str, ImportCost],
+    tolerance: float = 0.5,
+    slack_us: int = 5000,
+) -> List[str]:
+    """
+    Liste les régressions de `measured` par rapport à `budget`.
+
+    Le nombre de modules, déterministe, ne doit pas augmenter. Le temps, bruité, peut
+    dépasser le budget de `tolerance` (fraction) ou de `slack_us` microsecondes, la
+    plus grande des deux marges.
+    """
+    regressions = []
+    for name, cost in measured.items():
+        limit = budget.get(name)
+        if limit is None:
+            continue
+        if cost.modules > limit.modules:
+            regressions.append(f"{name}: {cost.modules} modules importés (budget {limit.modules})")
+        allowed = limit.us + max(limit.us * tolerance, slack_us)
+        if cost.us > allowed:
+            regressions.append(f"{name}: {cost.us} µs (budget {limit.us} µs, max {allowed:.0f})")
+    return regressions
+
+
+def load_budget(path: Path) -> Dict[str, ImportCost]:
+    """Lit le budget ; ValueError s'il a été mesuré sous une autre version de Python."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("python") != _python_version():
+        raise ValueError(
+            f"budget mesuré sous Python {data.get('python')}, exécution sous"
+            f" {_python_version()} : les coûts ne sont pas comparables (--update pour le refaire)"
+        )
+    return {name: ImportCost(**cost) for name, cost in data["targets"].items()}
+
+
+def save_budget(path: Path, measured: Dict[str, ImportCost]) -> None:
+    data = {"python": _python_version(), "targets": {n: asdict(c) for n, c in measured.items()}}
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def _python_version() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--budget", type=Path, default=Path(DEFAULT_BUDGET))
+    parser.add_argument("--update", action="store_true", help="réécrit le budget")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    budget: Dict[str, ImportCost] = {}
+    if not args.update:
+        if not args.budget.exists():
+            print(f"❌ Budget introuvable : {args.budget} (--update pour le créer)")
+            return 2
+        try:
+            budget = load_budget(args.budget)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 2
+
+    measured = measure_all(args.runs)
+    for name, cost in measured.items():
+        print(f"{name:<18} {cost.us / 1000:8.2f} ms  {cost.modules:4d} modules")
+
+    if args.update:
+        save_budget(args.budget, measured)
+        print(f"Budget écrit dans {args.budget}")
+        return 0
+
+    regressions = compare(budget, measured, args.tolerance)
+    for line in regressions:
+        print(f"❌ {line}")
+    if regressions:
+        return 1
+    print("✅ Coût d'import dans le budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Construit le couple `__getattr__` / `__dir__` d'un paquet à chargement paresseux.
+
+    Le sous-module qui définit un nom public n'est importé qu'au premier accès à
+    ce nom (PEP 562) ; la valeur est ensuite copiée dans le paquet, les accès
+    suivants ne passent plus par `__getattr__`.
+
+    Args:
+        package (str): Nom du paquet (`__name__`).
+        exports (Dict[str, str]): Nom public -> sous-module relatif (ex. ".sync").
+
+    Returns:
+        Tuple: Les fonctions `__getattr__` et `__dir__` du module.
+
+    Exemple:
+        __getattr__, __dir__ = lazy_exports(__name__, {"memoize": ".sync"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # __import__ plutôt qu'importlib, qui n'est pas chargé au démarrage de l'interpréteur
+        value = getattr(__import__(package + module, fromlist=[name]), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
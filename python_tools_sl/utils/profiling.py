@@ -0,0 +1,193 @@
+import io
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PROFILE_ENV = "PYTHON_TOOLS_PROFILE"
+TRACE_MEMORY_ENV = "PYTHON_TOOLS_TRACE_MEMORY"
+DEFAULT_OUTPUT_DIR = ".profiles"
+DEFAULT_MAX_REPORTS = 100
+
+# tracemalloc est global : les blocs `memory_tracing` concurrents (threads, tâches
+# asyncio) se partagent le traçage, arrêté par le dernier sorti s'il l'a démarré.
+_tracing_lock = threading.Lock()
+_active_tracers = 0
+_owns_tracing = False
+
+
+def should_sample(sample_rate: float = 1.0, env_var: Optional[str] = None) -> bool:
+    """
+    Décide si l'appel courant doit être instrumenté.
+
+    Si la variable d'environnement `env_var` est définie, elle décide seule
+    ("1", "true", "yes", "on" → oui, toute autre valeur → non). Sinon, l'appel est
+    retenu avec la probabilité `sample_rate`.
+
+    Args:
+        sample_rate (float): Probabilité d'instrumenter l'appel, entre 0 et 1.
+        env_var (str, optionnel): Variable d'environnement qui force la décision.
+
+    Returns:
+        bool: True si l'appel doit être instrumenté.
+    """
+    if env_var is not None:
+        value = os.environ.get(env_var)
+        if value is not None:
+            from python_tools_sl.parsing.parsers import parse_bool
+
+            return parse_bool(value)
+    if sample_rate >= 1.0:
+        return True
+    import random  # pathlib, random, parsing : chargés au premier usage
+
+    return random.random() < sample_rate
+
+
+def sampler(
+    sample_rate: float, env_var: Optional[str], max_reports: Optional[int] = DEFAULT_MAX_REPORTS
+) -> Callable[[], bool]:
+    """
+    Construit la décision d'échantillonnage d'une fonction décorée.
+
+    Comme `should_sample`, mais au plus `max_reports` appels sont retenus sur la
+    durée de vie du processus (None : sans limite), pour qu'un chemin chaud ne
+    remplisse pas le disque de rapports.
+    """
+    retained = itertools.count()
+
+    def sample() -> bool:
+        if not should_sample(sample_rate, env_var):
+            return False
+        return max_reports is None or next(retained) < max_reports
+
+    return sample
+
+
+def _output_path(output_dir: str | os.PathLike[str], name: str, suffix: str) -> "Path":
+    from pathlib import Path
+
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return directory / f"{name}-{stamp}-{os.getpid()}-{time.perf_counter_ns()}{suffix}"
+
+
+@contextmanager
+def profiling(
+    name: str = "block",
+    output_dir: str | os.PathLike[str] = DEFAULT_OUTPUT_DIR,
+    top: int = 20,
+    sort: str = "cumulative",
+    enabled: bool = True,
+) -> Iterator[Optional["Path"]]:
+    """
+    Profile un bloc avec cProfile et écrit les points chauds dans `output_dir`.
+
+    Deux fichiers sont produits : `<nom>-....prof` (stats binaires, lisibles par
+    `pstats`, snakeviz...) et `<nom>-....txt` (les `top` fonctions triées par `sort`).
+    Le chemin du `.txt` est disponible après le bloc via la valeur du `with`.
+
+    Un seul profileur peut être actif à la fois : si un autre tourne déjà (bloc
+    imbriqué), le bloc s'exécute sans profil. Dans une coroutine, le profil couvre
+    aussi les autres tâches exécutées par le thread pendant les `await`.
+
+    Args:
+        name (str): Préfixe des fichiers produits.
+        output_dir (str | os.PathLike): Dossier de sortie. Par défaut ".profiles".
+        top (int): Nombre de fonctions listées dans le rapport texte. Par défaut 20.
+        sort (str): Clé de tri `pstats` ("cumulative", "tottime"...).
+        enabled (bool): Permet de désactiver le profil sans changer le code.
+
+    Exemple:
+        >>> with profiling("parse") as report:
+        ...     parse_all()
+        >>> print(report.read_text())
+    """
+    if not enabled or sys.getprofile() is not None:  # désactivé, ou profileur déjà actif
+        yield None
+        return
+    import cProfile  # importés à l'usage : inutiles au démarrage des décorateurs
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # Python 3.12+ : profileur déjà actif (sys.monitoring)
+        yield None
+        return
+    report = _output_path(output_dir, name, ".txt")
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        profiler.dump_stats(report.with_suffix(".prof"))
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(top)
+        report.write_text(stream.getvalue(), encoding="utf-8")
+
+
+@contextmanager
+def memory_tracing(
+    name: str = "block",
+    output_dir: str | os.PathLike[str] = DEFAULT_OUTPUT_DIR,
+    top: int = 20,
+    key_type: str = "lineno",
+    frames: int = 1,
+    enabled: bool = True,
+) -> Iterator[Optional["Path"]]:
+    """
+    Trace les allocations d'un bloc avec tracemalloc et écrit les principaux sites.
+
+    Le rapport `<nom>-....mem.txt` liste les `top` lignes (ou fichiers, ou traces
+    selon `key_type`) dont la mémoire allouée a le plus augmenté pendant le bloc,
+    ainsi que le pic mémoire observé. Si tracemalloc était déjà actif, il n'est pas
+    arrêté à la sortie. Les blocs concurrents (threads, tâches asyncio) partagent le
+    traçage : chacun voit aussi les allocations des autres, et le pic n'est remis à
+    zéro que par un bloc seul actif.
+
+    Args:
+        name (str): Préfixe du fichier produit.
+        output_dir (str | os.PathLike): Dossier de sortie. Par défaut ".profiles".
+        top (int): Nombre de sites listés. Par défaut 20.
+        key_type (str): Regroupement des statistiques ("lineno", "filename", "traceback").
+        frames (int): Profondeur de pile enregistrée par allocation. Par défaut 1.
+        enabled (bool): Permet de désactiver le traçage sans changer le code.
+    """
+    if not enabled:
+        yield None
+        return
+    import tracemalloc  # importé à l'usage, comme cProfile
+
+    global _active_tracers, _owns_tracing
+    report = _output_path(output_dir, name, ".mem.txt")
+    with _tracing_lock:
+        if _active_tracers == 0:
+            _owns_tracing = not tracemalloc.is_tracing()
+            if _owns_tracing:
+                tracemalloc.start(frames)
+        _active_tracers += 1
+        if _active_tracers == 1:
+            tracemalloc.reset_peak()
+    # tant que ce bloc est compté dans `_active_tracers`, personne n'arrête le traçage
+    before = tracemalloc.take_snapshot()
+    try:
+        yield report
+    finally:
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        with _tracing_lock:
+            _active_tracers -= 1
+            if _active_tracers == 0 and _owns_tracing:
+                tracemalloc.stop()
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), key_type)
+        lines = [f"[{name}] pic mémoire : {peak / 1024:.1f} KiB", ""]
+        lines += [str(stat) for stat in stats[:top]]
+        report.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    @contextmanager
+    def _locked(f: IO[str]) -> Iterator[None]:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    @contextmanager
+    def _locked(f: IO[str]) -> Iterator[None]:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class FileRateBudget:
+    """
+    Budget de débit partagé entre processus, stocké dans un fichier verrouillé.
+
+    Implémente un « token bucket » sous forme GCRA : le fichier ne contient que la
+    date théorique du prochain créneau libre. Chaque `acquire()` réserve un créneau
+    sous verrou (une lecture + une écriture), puis dort *hors verrou* jusqu'à ce
+    créneau. Tous les processus qui pointent vers le même fichier (par exemple les
+    workers pytest-xdist) se partagent donc `rate` appels par seconde, avec des
+    rafales d'au plus `burst` appels.
+
+    Args:
+        path (str | os.PathLike): Fichier d'état partagé (créé si besoin).
+        rate (float): Nombre d'appels autorisés par seconde.
+        burst (int): Nombre d'appels pouvant partir sans attendre. Par défaut 1.
+
+    Exemple:
+        >>> budget = FileRateBudget("/tmp/x_com.budget", rate=0.5)  # 1 appel / 2 s
+        >>> budget.acquire()
+        0.0
+    """
+
+    def __init__(self, path: str | os.PathLike[str], rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate doit être strictement positif")
+        if burst < 1:
+            raise ValueError("burst doit être au moins 1")
+        self.path = Path(path)
+        self.rate = rate
+        self.burst = burst
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    def reserve(self) -> float:
+        """Réserve un créneau et retourne le temps d'attente (en secondes) avant de l'utiliser."""
+        interval = 1.0 / self.rate
+        tolerance = (self.burst - 1) * interval
+        with open(self.path, "r+", encoding="utf-8") as f, _locked(f):
+            raw = f.read()
+            try:
+                tat = float(json.loads(raw)["tat"]) if raw else 0.0
+            except (ValueError, KeyError, TypeError):
+                tat = 0.0
+            now = time.time()
+            tat = max(tat, now)
+            start = max(now, tat - tolerance)
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps({"tat": tat + interval}))
+            f.flush()
+        return start - now
+
+    def acquire(self) -> float:
+        """Attend son tour (bloquant) et retourne le temps passé à attendre."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Comme `acquire`, sans bloquer la boucle d'événements pendant l'attente."""
+        wait = await asyncio.to_thread(self.reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
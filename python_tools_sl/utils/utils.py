@@ -1,7 +1,13 @@
+import os
+import threading
 import time
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from itertools import islice
-from typing import Iterable, Iterator, List, TypeVar
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from python_tools_sl.utils.formatting import format_duration
 
 T = TypeVar("T")
 
@@ -33,26 +39,202 @@ def chunks(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
         yield batch
 
 
+@dataclass
+class SpanStats:
+    """
+    Statistiques agrégées d'un span de `timer` (un nœud de l'arbre des appels).
+
+    Attributes:
+        name (str): Nom du span.
+        count (int): Nombre d'exécutions du span à cet emplacement de l'arbre.
+        total (float): Temps cumulé en secondes (enfants inclus).
+        children_total (float): Temps cumulé passé dans les spans enfants.
+        children (dict[str, SpanStats]): Spans imbriqués, indexés par nom.
+    """
+
+    name: str
+    count: int = 0
+    total: float = 0.0
+    children_total: float = 0.0
+    children: Dict[str, "SpanStats"] = field(default_factory=dict)
+
+    @property
+    def self_time(self) -> float:
+        """Temps propre du span (hors enfants), jamais négatif.
+
+        Des enfants exécutés en parallèle (threads, tâches asyncio) peuvent cumuler
+        plus de temps que leur parent : le temps propre est alors ramené à 0.
+        """
+        return max(self.total - self.children_total, 0.0)
+
+
+class TimerReport:
+    """
+    Arbre des spans `timer` collectés, avec export au format « collapsed stacks ».
+
+    Le rapport est thread-safe : les spans terminés dans plusieurs threads ou
+    tâches asyncio y sont fusionnés sous un verrou.
+
+    Exemple:
+        >>> report = TimerReport()
+        >>> with timer("requête", report=report, verbose=False):
+        ...     with timer("parse", report=report, verbose=False):
+        ...         parse()
+        >>> report.export_collapsed("profile.folded")  # pour flamegraph.pl / speedscope
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.root = SpanStats("<root>")
+
+    def record(self, path: Tuple[str, ...], duration: float, children_total: float) -> None:
+        """Ajoute une exécution terminée du span identifié par `path` (noms depuis la racine)."""
+        with self._lock:
+            node = self.root
+            for name in path:
+                node = node.children.setdefault(name, SpanStats(name))
+            node.count += 1
+            node.total += duration
+            node.children_total += children_total
+
+    def reset(self) -> None:
+        """Vide le rapport."""
+        with self._lock:
+            self.root = SpanStats("<root>")
+
+    def by_name(self) -> Dict[str, Dict[str, float]]:
+        """
+        Agrège les statistiques par nom de span, toutes positions confondues.
+
+        Le temps cumulé d'un span récursif n'est compté qu'une fois par pile
+        (l'occurrence la plus externe), comme le font les profileurs classiques.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Pour chaque nom, `count`, `total` et `self`.
+        """
+        stats: Dict[str, Dict[str, float]] = {}
+
+        def walk(node: SpanStats, ancestors: Tuple[str, ...]) -> None:
+            for child in node.children.values():
+                entry = stats.setdefault(child.name, {"count": 0, "total": 0.0, "self": 0.0})
+                entry["count"] += child.count
+                entry["self"] += child.self_time
+                if child.name not in ancestors:
+                    entry["total"] += child.total
+                walk(child, ancestors + (child.name,))
+
+        with self._lock:
+            walk(self.root, ())
+        return stats
+
+    def collapsed_stacks(self) -> List[str]:
+        """
+        Exporte l'arbre au format « collapsed stacks » (une ligne par pile).
+
+        Chaque ligne a la forme `parent;enfant;petit-enfant <temps propre en µs>`,
+        directement lisible par flamegraph.pl, speedscope ou inferno.
+
+        Returns:
+            List[str]: Les lignes du fichier, sans retour à la ligne final.
+        """
+        lines: List[str] = []
+
+        def walk(node: SpanStats, stack: Tuple[str, ...]) -> None:
+            for child in node.children.values():
+                child_stack = stack + (child.name.replace(";", ":").replace(" ", "_"),)
+                micros = round(child.self_time * 1e6)
+                if micros > 0:
+                    lines.append(f"{';'.join(child_stack)} {micros}")
+                walk(child, child_stack)
+
+        with self._lock:
+            walk(self.root, ())
+        return lines
+
+    def export_collapsed(self, path: str | os.PathLike[str]) -> None:
+        """Écrit les piles au format « collapsed stacks » dans le fichier `path`."""
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.collapsed_stacks():
+                f.write(line + "\n")
+
+    def format(self) -> str:
+        """Retourne une représentation textuelle indentée de l'arbre des spans."""
+        lines: List[str] = []
+
+        def walk(node: SpanStats, depth: int) -> None:
+            for child in node.children.values():
+                lines.append(
+                    f"{'  ' * depth}{child.name}: {child.count}x, "
+                    f"total {format_duration(child.total)}, "
+                    f"propre {format_duration(child.self_time)}"
+                )
+                walk(child, depth + 1)
+
+        with self._lock:
+            walk(self.root, 0)
+        return "\n".join(lines)
+
+
+class _ActiveSpan:
+    """Span `timer` en cours d'exécution (partagé par les contextes enfants)."""
+
+    __slots__ = ("path", "children_total", "lock")
+
+    def __init__(self, path: Tuple[str, ...]) -> None:
+        self.path = path
+        self.children_total = 0.0
+        self.lock = threading.Lock()
+
+    def add_child(self, duration: float) -> None:
+        with self.lock:
+            self.children_total += duration
+
+
+#: Rapport global alimenté par défaut par `timer`.
+TIMER_REPORT = TimerReport()
+
+_current_span: ContextVar[Optional[_ActiveSpan]] = ContextVar("timer_current_span", default=None)
+
+
 @contextmanager
-def timer(name: str = "block"):  # type: ignore
+def timer(
+    name: str = "block", report: Optional[TimerReport] = None, verbose: bool = True
+) -> Iterator[None]:
     """
     Mesure le temps d'exécution d'un bloc de code.
 
+    Les blocs imbriqués sont suivis via `contextvars` : le span parent est donc
+    correct dans chaque thread et chaque tâche asyncio (une tâche hérite du span
+    actif au moment de sa création). Chaque span terminé est enregistré dans
+    `report` (par défaut `TIMER_REPORT`) avec son temps cumulé et son temps propre.
+
     Args:
         name (str): Nom du bloc à afficher dans la sortie.
+        report (TimerReport, optionnel): Rapport qui collecte les spans.
+            Par défaut le rapport global `TIMER_REPORT`.
+        verbose (bool): Affiche la durée du bloc à la sortie. Par défaut True.
 
     Exemple:
         >>> with timer("scraping"):
         ...     do_scraping()
         # [scraping] terminé en 2.34s
     """
+    parent = _current_span.get()
+    span = _ActiveSpan(parent.path + (name,) if parent is not None else (name,))
+    token = _current_span.set(span)
     start = time.perf_counter()
     try:
         yield
     finally:
-        end = time.perf_counter()
-        duration = end - start
-        print(f"[{name}] terminé en {duration:.2f}s")
+        duration = time.perf_counter() - start
+        _current_span.reset(token)
+        if parent is not None:
+            parent.add_child(duration)
+        (report if report is not None else TIMER_REPORT).record(
+            span.path, duration, span.children_total
+        )
+        if verbose:
+            print(f"[{name}] terminé en {duration:.2f}s")
 
 
 if __name__ == "__main__":
@@ -89,3 +271,5 @@ if __name__ == "__main__":
         total = 0
         for i in range(1000000):
             total += i
+
+    print(TIMER_REPORT.format())
@@ -116,6 +116,18 @@ def test(c):
     c.run("python -m pytest tests")
 
 
+@task
+def bench(c):
+    """Run the benchmarks (logging formatters)."""
+    c.run("python -m python_tools_sl.logtools.benchmark")
+
+
+@task
+def importtime(c, update=False):
+    """Check import cost (python -X importtime) against importtime_budget.json."""
+    c.run(f"python -m python_tools_sl.utils.importtime{' --update' if update else ''}")
+
+
 @task
 def coverage(c):
     """Run unit-tests using pytest, with coverage reporting."""
@@ -1,5 +1,7 @@
 import pytest
 
+pytest_plugins = ["pytester"]
+
 # Configure pytest-asyncio pour utiliser une boucle "auto" par défaut
 
 
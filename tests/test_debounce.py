@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from python_tools_sl.decorators import debounce, debounce_async, throttle, throttle_async
+
+
+@pytest.mark.asyncio
+async def test_debounce_async_merges_burst_per_key():
+    calls = []
+
+    @debounce_async(0.05, key=lambda path, n: path)
+    async def handle(path, n):
+        calls.append((path, n))
+        return n
+
+    results = await asyncio.gather(*(handle(p, n) for n in range(50) for p in ("a", "b")))
+
+    assert sorted(calls) == [("a", 49), ("b", 49)]
+    assert set(results) == {49}  # tous les appelants reçoivent le résultat de l'exécution
+
+
+@pytest.mark.asyncio
+async def test_debounce_async_leading_edge():
+    calls = []
+
+    @debounce_async(0.05, leading=True, trailing=False)
+    async def handle(n):
+        calls.append(n)
+        return n
+
+    results = await asyncio.gather(*(handle(n) for n in range(10)))
+    assert calls == [0]
+    assert results == [0] * 10
+
+
+@pytest.mark.asyncio
+async def test_debounce_async_bounded_keys():
+    calls = []
+
+    @debounce_async(10, key=lambda k: k, max_keys=2)
+    async def handle(k):
+        calls.append(k)
+        return k
+
+    tasks = [asyncio.ensure_future(handle(k)) for k in range(3)]
+    await asyncio.sleep(0.01)
+    # la 3e clé a forcé l'exécution de la plus ancienne
+    assert calls == [0]
+    assert tasks[0].done() and tasks[0].result() == 0
+    for t in tasks[1:]:
+        t.cancel()
+
+
+@pytest.mark.asyncio
+async def test_throttle_async_leading_and_trailing():
+    calls = []
+
+    @throttle_async(0.05)
+    async def handle(n):
+        calls.append(n)
+        return n
+
+    first = await handle(0)
+    results = await asyncio.gather(*(handle(n) for n in range(1, 20)))
+
+    assert first == 0
+    assert calls == [0, 19]
+    assert set(results) == {19}
+
+
+def test_debounce_sync_runs_once_after_silence():
+    calls = []
+    done = threading.Event()
+
+    @debounce(0.05)
+    def handle(n):
+        calls.append(n)
+        done.set()
+
+    for n in range(20):
+        assert handle(n) is None
+    assert done.wait(1)
+    time.sleep(0.06)
+    assert calls == [19]
+
+
+def test_throttle_sync_leading_returns_result():
+    calls = []
+
+    @throttle(0.05)
+    def handle(n):
+        calls.append(n)
+        return n
+
+    assert handle(0) == 0
+    for n in range(1, 10):
+        assert handle(n) is None
+    time.sleep(0.15)
+    assert calls == [0, 9]
+
+
+def test_debounce_requires_an_edge():
+    with pytest.raises(ValueError):
+        debounce(0.1, leading=False, trailing=False)(lambda: None)
+
+
+def test_debounce_burst_does_not_spawn_a_thread_per_call(monkeypatch):
+    started = []
+    timer_cls = threading.Timer
+
+    class CountingTimer(timer_cls):
+        def start(self):
+            started.append(self)
+            super().start()
+
+    monkeypatch.setattr(threading, "Timer", CountingTimer)
+    calls = []
+
+    @debounce(0.05)
+    def handle(n):
+        calls.append(n)
+
+    for n in range(300):
+        handle(n)
+    time.sleep(0.2)
+
+    assert calls == [299]
+    assert len(started) <= 3  # un minuteur par fenêtre, pas un par appel
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+
+from python_tools_sl.decorators import retry_async
+from python_tools_sl.decorators.async_ import HedgePolicy
+
+
+@pytest.mark.asyncio
+async def test_hedge_beats_slow_first_attempt():
+    delays = [1.0, 0.01]
+    started, cancelled = [], []
+
+    @retry_async(hedge_after=0.05, hedge_budget=1.0)
+    async def call():
+        i = len(started)
+        started.append(i)
+        try:
+            await asyncio.sleep(delays[i])
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+        return i
+
+    start = time.perf_counter()
+    assert await call() == 1
+    assert time.perf_counter() - start < 0.5
+    await asyncio.sleep(0)
+    assert cancelled == [0]
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_when_fast():
+    calls = []
+
+    @retry_async(hedge_after=0.2)
+    async def call():
+        calls.append(1)
+        return "ok"
+
+    assert await call() == "ok"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_failure_waits_for_other_attempt():
+    calls = []
+
+    @retry_async(max_attempts=1, hedge_after=0.01, hedge_budget=1.0)
+    async def call():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise ValueError("first failed")
+        await asyncio.sleep(0.1)
+        return "second"
+
+    assert await call() == "second"
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_extra_load():
+    calls = []
+
+    @retry_async(hedge_after=0.001, hedge_budget=0.0)
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return True
+
+    for _ in range(20):
+        await call()
+    # budget vide au départ, aucun crédit ensuite : aucune copie
+    assert len(calls) == 20
+    assert call.hedge_policy.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_is_a_fraction_of_calls():
+    @retry_async(hedge_after=0.001, hedge_budget=0.25)
+    async def call():
+        await asyncio.sleep(0.005)
+        return True
+
+    for _ in range(20):
+        await call()
+    assert call.hedge_policy.hedges == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("winner", [0, 1])
+async def test_hedge_success_finishing_with_a_failure(winner):
+    release = asyncio.Event()
+    started = []
+
+    async def call():
+        i = len(started)
+        started.append(i)
+        if i == 1:
+            asyncio.get_running_loop().call_soon(release.set)
+        await release.wait()  # les deux tentatives se terminent au même tour
+        if i != winner:
+            raise ValueError("boom")
+        return i
+
+    policy = HedgePolicy(hedge_after=0.01, initial_tokens=1)
+    assert await policy.run(call, max_hedges=1) == winner
+    assert len(started) == 2
+
+
+def test_hedge_policy_initial_tokens():
+    policy = HedgePolicy(hedge_after=0.01, budget=0.0, initial_tokens=2)
+    assert [policy.try_hedge() for _ in range(3)] == [True, True, False]
+
+
+def test_hedge_policy_learns_percentile():
+    policy = HedgePolicy(hedge_after=1.0, percentile=90, min_samples=10)
+    assert policy.delay() == 1.0
+    for i in range(1, 101):
+        policy.record(i / 1000)
+    assert policy.delay() == pytest.approx(0.091)
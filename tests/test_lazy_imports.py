@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+import pytest
+
+import python_tools_sl.decorators as decorators
+from python_tools_sl.utils.importtime import (
+    ImportCost,
+    compare,
+    load_budget,
+    main,
+    parse_importtime,
+)
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_sync_decorators_do_not_import_asyncio():
+    out = _run(
+        "import sys\n"
+        "from python_tools_sl.decorators import memoize\n"
+        "print('asyncio' in sys.modules, 'python_tools_sl.decorators.async_' in sys.modules)\n"
+        "print('http.server' in sys.modules, 'cProfile' in sys.modules)\n"
+    )
+    assert out == ["False", "False", "False", "False"]
+
+
+def test_importing_public_modules_has_no_side_effect():
+    out = _run(
+        "import logging\n"
+        "import python_tools_sl.logtools.examples\n"
+        "from python_tools_sl.logtools import setup_logging, log_call\n"
+        "print(len(logging.getLogger().handlers))\n"
+    )
+    assert out == ["0"]
+
+
+def test_lazy_package_attributes():
+    assert "retry_async" in dir(decorators)
+    assert decorators.retry_async is decorators.async_.retry_async
+    with pytest.raises(AttributeError):
+        decorators.nope
+
+
+def test_parse_importtime_and_compare():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       380 |        500 | json\n"
+    )
+    cost = parse_importtime(stderr)
+    assert cost == ImportCost(us=500, modules=2)
+    budget = {"json": ImportCost(us=500, modules=2)}
+    assert compare(budget, {"json": cost}) == []
+    assert len(compare(budget, {"json": ImportCost(us=500, modules=3)})) == 1
+    assert len(compare(budget, {"json": ImportCost(us=10_000, modules=2)}, slack_us=0)) == 1
+
+
+def test_importtime_requires_a_matching_budget(tmp_path, capsys):
+    path = tmp_path / "budget.json"
+    assert main(["--budget", str(path)]) == 2
+    assert not path.exists()
+
+    path.write_text('{"python": "2.7", "targets": {}}', encoding="utf-8")
+    with pytest.raises(ValueError, match="Python 2.7"):
+        load_budget(path)
+    assert main(["--budget", str(path)]) == 2
+    assert "Python 2.7" in capsys.readouterr().out
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import logging
+import logging.handlers
+import re
+import sys
+import threading
+
+import pytest
+
+from python_tools_sl.logtools import (
+    ChromeTraceExporter,
+    JsonFormatter,
+    add_span_exporter,
+    log_call,
+    log_section,
+    remove_span_exporter,
+    setup_logging,
+    shutdown_logging,
+)
+from python_tools_sl.logtools.config import BatchingQueueListener, StructuredQueueHandler
+
+
+@pytest.fixture
+def root_logger():
+    """Restaure les handlers et le niveau du logger racine après le test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_setup_logging_queue_mode_writes_file(root_logger, tmp_path):
+    logfile = tmp_path / "app.log"
+    listener = setup_logging(to_file=True, to_console=False, filename=str(logfile), use_queue=True)
+
+    assert isinstance(listener, BatchingQueueListener)
+    assert [type(h) for h in root_logger.handlers] == [StructuredQueueHandler]
+
+    for i in range(500):
+        logging.info("message %d", i)
+    shutdown_logging()
+
+    lines = logfile.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 500
+    assert re.fullmatch(r"\[INFO\] \d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} - message 499", lines[-1])
+    # le QueueHandler est retiré à l'arrêt
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers)
+
+
+def test_setup_logging_queue_mode_rotation(root_logger, tmp_path):
+    logfile = tmp_path / "app.log"
+    setup_logging(
+        to_file=True,
+        to_console=False,
+        filename=str(logfile),
+        use_queue=True,
+        max_bytes=1024,
+        backup_count=2,
+    )
+    for i in range(200):
+        logging.warning("rotation %d", i)
+    shutdown_logging()
+
+    assert logfile.exists()
+    assert (tmp_path / "app.log.1").exists()
+    assert not (tmp_path / "app.log.3").exists()
+    assert logfile.stat().st_size <= 1024
+
+
+def test_setup_logging_direct_mode_returns_none(root_logger, tmp_path):
+    root_logger.handlers.clear()
+    assert setup_logging(to_console=False, to_file=True, filename=str(tmp_path / "a.log")) is None
+    shutdown_logging()  # sans listener : ne fait rien
+
+
+def test_log_call_logs_args_result_and_duration(caplog):
+    @log_call
+    def add(a, b):
+        return a + b
+
+    with caplog.at_level(logging.DEBUG):
+        assert add(2, b=3) == 5
+
+    calling, returned = [r.getMessage() for r in caplog.records]
+    assert (
+        calling
+        == "Calling test_log_call_logs_args_result_and_duration.<locals>.add with args=(2) kwargs={'b': 3}"
+    )
+    assert " returned 5 in " in returned
+
+
+def test_log_call_skipped_when_level_disabled(caplog):
+    class Boom:
+        def __repr__(self):
+            raise AssertionError("repr ne doit pas être appelé")
+
+    @log_call
+    def identity(x):
+        return x
+
+    with caplog.at_level(logging.INFO):
+        boom = Boom()
+        assert identity(boom) is boom
+    assert caplog.records == []
+
+
+def test_log_call_truncates_repr(caplog):
+    @log_call(max_repr=20)
+    def big(data):
+        return "x" * 1000
+
+    with caplog.at_level(logging.DEBUG):
+        big(list(range(10_000)))
+
+    for record in caplog.records:
+        assert len(record.getMessage()) < 150
+
+
+def test_log_call_sampling(caplog):
+    @log_call(sample_rate=0.0)
+    def noop():
+        return None
+
+    with caplog.at_level(logging.DEBUG):
+        for _ in range(10):
+            noop()
+    assert caplog.records == []
+
+
+@pytest.mark.asyncio
+async def test_log_call_coroutine_logs_awaited_result(caplog):
+    @log_call(level=logging.INFO)
+    async def double(x):
+        return x * 2
+
+    with caplog.at_level(logging.INFO):
+        assert await double(21) == 42
+
+    assert "returned 42 in" in caplog.records[-1].getMessage()
+
+
+def test_log_call_logs_exception(caplog):
+    @log_call
+    def fail():
+        raise ValueError("nope")
+
+    with caplog.at_level(logging.DEBUG), pytest.raises(ValueError):
+        fail()
+    assert "raised ValueError('nope')" in caplog.records[-1].getMessage()
+
+
+def test_json_formatter_key_order_and_extras():
+    record = logging.LogRecord("app", logging.WARNING, __file__, 1, "hello %s", ("bob",), None)
+    record.user_id = 42
+    data = json.loads(JsonFormatter().format(record))
+
+    assert list(data) == ["timestamp", "level", "logger", "message", "user_id"]
+    assert data["level"] == "WARNING"
+    assert data["message"] == "hello bob"
+    assert data["user_id"] == 42
+    assert data["timestamp"].endswith("Z")
+
+
+def test_json_formatter_timestamp_from_threads():
+    formatter = JsonFormatter()
+    records = []
+    for created in (0.5, 86_400.25):
+        record = logging.LogRecord("app", logging.INFO, __file__, 1, "m", None, None)
+        record.created, record.msecs = created, (created % 1) * 1000
+        records.append(record)
+    expected = ["1970-01-01T00:00:00.500Z", "1970-01-02T00:00:00.250Z"]
+    errors = []
+
+    def run(record, stamp):
+        for _ in range(2000):
+            if json.loads(formatter.format(record))["timestamp"] != stamp:
+                errors.append(stamp)
+
+    threads = [threading.Thread(target=run, args=pair) for pair in zip(records, expected)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def test_json_formatter_exception_and_stdlib_encoder():
+    formatter = JsonFormatter(dumps=json.JSONEncoder(default=str).encode)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("app").makeRecord(
+            "app", logging.ERROR, __file__, 1, "failed", (), sys.exc_info(), extra={"obj": object()}
+        )
+    data = json.loads(formatter.format(record))
+    assert "ValueError: boom" in data["exc_info"]
+    assert data["obj"].startswith("<object object")
+
+
+def test_setup_logging_json_format(root_logger, tmp_path):
+    root_logger.handlers.clear()
+    logfile = tmp_path / "app.log"
+    setup_logging(to_file=True, to_console=False, filename=str(logfile), log_format="json")
+    logging.getLogger("svc").info("ready", extra={"port": 8080})
+    for handler in root_logger.handlers:
+        handler.flush()
+
+    data = json.loads(logfile.read_text(encoding="utf-8").splitlines()[-1])
+    assert data["logger"] == "svc"
+    assert data["port"] == 8080
+
+
+def test_setup_logging_queue_json_keeps_exception(root_logger, tmp_path):
+    logfile = tmp_path / "app.log"
+    setup_logging(
+        to_file=True, to_console=False, filename=str(logfile), use_queue=True, log_format="json"
+    )
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.exception("boom %d", 1, extra={"user": 5})
+    logging.info("stack", stack_info=True)
+    shutdown_logging()
+
+    error, stack = [json.loads(line) for line in logfile.read_text(encoding="utf-8").splitlines()]
+    assert error["message"] == "boom 1"
+    assert error["user"] == 5
+    assert error["exc_info"].startswith("Traceback")
+    assert "ValueError: boom" in error["exc_info"]
+    assert stack["message"] == "stack"
+    assert stack["stack_info"].startswith("Stack (most recent call last)")
+
+
+@pytest.fixture
+def trace_exporter(tmp_path):
+    exporter = ChromeTraceExporter(tmp_path / "trace.json")
+    add_span_exporter(exporter)
+    yield exporter
+    remove_span_exporter(exporter)
+
+
+def _trace_events(exporter):
+    exporter.write()
+    with open(exporter.path, encoding="utf-8") as f:
+        return {e["name"]: e for e in json.load(f)["traceEvents"]}
+
+
+def test_log_section_nested_spans(caplog, trace_exporter):
+    with caplog.at_level(logging.INFO):
+        with log_section("outer") as outer:
+            with log_section("inner", item=3) as inner:
+                pass
+
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert outer.duration >= inner.duration > 0
+    assert caplog.records[-1].getMessage().startswith("<<< Exiting section: outer (")
+
+    events = _trace_events(trace_exporter)
+    assert events["inner"]["ph"] == "X"
+    assert events["inner"]["args"] == {
+        "span_id": inner.span_id,
+        "parent_id": outer.span_id,
+        "item": 3,
+    }
+    assert events["outer"]["ts"] <= events["inner"]["ts"]
+
+
+@pytest.mark.asyncio
+async def test_log_section_async_tasks(trace_exporter):
+    async def child(i):
+        async with log_section(f"child-{i}"):
+            await asyncio.sleep(0.01)
+
+    async with log_section("parent") as parent:
+        await asyncio.gather(child(1), child(2))
+
+    events = _trace_events(trace_exporter)
+    assert events["child-1"]["args"]["parent_id"] == parent.span_id
+    assert events["child-2"]["args"]["parent_id"] == parent.span_id
+    # deux tâches concurrentes : deux pistes distinctes dans la trace
+    assert events["child-1"]["tid"] != events["child-2"]["tid"]
+
+
+def test_log_section_records_error(trace_exporter):
+    with pytest.raises(KeyError):
+        with log_section("failing"):
+            raise KeyError("x")
+    assert _trace_events(trace_exporter)["failing"]["args"]["error"] == "KeyError"
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from python_tools_sl.decorators import memoize, memoize_async
+
+
+def test_memoize_caches():
+    calls = []
+
+    @memoize
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == square(3) == 9
+    assert calls == [3]
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_bare_and_concurrent_misses_share_call():
+    calls = []
+
+    @memoize_async
+    async def slow(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 2
+
+    assert await asyncio.gather(slow(1), slow(1), slow(1)) == [2, 2, 2]
+    assert await slow(1) == 2
+    assert calls == [1]
+
+
+def _counter():
+    state = {"n": 0}
+
+    async def compute(key):
+        state["n"] += 1
+        await asyncio.sleep(0.02)
+        return f"{key}-{state['n']}"
+
+    return state, compute
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_serves_stale_while_revalidating():
+    state, compute = _counter()
+    cached = memoize_async(ttl=0.05, stale_while_revalidate=1.0)(compute)
+
+    assert await cached("a") == "a-1"
+    await asyncio.sleep(0.06)  # expiré mais dans la fenêtre stale
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await cached("a") == "a-1"  # servi tout de suite
+    assert loop.time() - start < 0.01
+    await asyncio.sleep(0.05)  # le rafraîchissement de fond se termine
+    assert await cached("a") == "a-2"
+    assert state["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_recomputes_after_stale_window():
+    state, compute = _counter()
+    cached = memoize_async(ttl=0.02)(compute)
+
+    assert await cached("a") == "a-1"
+    await asyncio.sleep(0.03)
+    assert await cached("a") == "a-2"
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_refresh_ahead_for_hot_keys():
+    state, compute = _counter()
+    cached = memoize_async(ttl=0.2, refresh_ahead=0.5, refresh_min_hits=2)(compute)
+
+    await cached("hot")
+    await cached("cold")
+    await asyncio.sleep(0.12)  # au-delà de 50 % du TTL
+    await cached("hot")
+    await cached("cold")  # 1 seul accès : pas de refresh
+    assert await cached("hot") == "hot-1"  # 2e accès : refresh lancé, valeur actuelle servie
+    await asyncio.sleep(0.05)
+    assert await cached("hot") == "hot-3"
+    assert await cached("cold") == "cold-2"
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_background_failure_keeps_stale_value():
+    fail = {"on": False}
+
+    @memoize_async(ttl=0.01, stale_while_revalidate=1.0)
+    async def value():
+        if fail["on"]:
+            raise RuntimeError("upstream down")
+        return 42
+
+    assert await value() == 42
+    fail["on"] = True
+    await asyncio.sleep(0.02)
+    assert await value() == 42
+    await asyncio.sleep(0.01)
+    assert await value() == 42
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_cancelled_caller_does_not_cancel_others():
+    calls = []
+
+    @memoize_async
+    async def slow(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    a = asyncio.create_task(slow(1))
+    await asyncio.sleep(0)
+    b = asyncio.create_task(slow(1))
+    await asyncio.sleep(0.01)
+    a.cancel()
+
+    assert await b == 2
+    assert a.cancelled()
+    assert await slow(1) == 2  # le calcul partagé a rempli le cache
+    assert calls == [1]
@@ -0,0 +1,114 @@
+import asyncio
+import urllib.request
+
+import pytest
+
+from python_tools_sl.decorators import memoize, memoize_async, retry, timeit, with_pause
+from python_tools_sl.metrics import (
+    REGISTRY,
+    Registry,
+    enable_metrics,
+    render_openmetrics,
+    start_metrics_server,
+)
+from python_tools_sl.metrics.instruments import function_label
+
+
+@pytest.fixture
+def metrics_on():
+    enable_metrics()
+    yield REGISTRY
+    enable_metrics(False)
+
+
+def test_render_openmetrics_counter_gauge_histogram():
+    registry = Registry()
+    registry.counter("jobs", "Jobs faits", ["queue"]).inc(2, queue='a"b')
+    registry.gauge("workers", "Workers actifs").set(3)
+    hist = registry.histogram("latency_seconds", "Latence", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        hist.observe(value)
+
+    text = render_openmetrics(registry)
+
+    assert 'jobs_total{queue="a\\"b"} 2\n' in text
+    assert "# TYPE workers gauge\n" in text and "workers 3\n" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1\n' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2\n' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3\n' in text
+    assert "latency_seconds_count 3\n" in text
+    assert "latency_seconds_sum 2.55\n" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_registry_rejects_type_conflicts_and_bad_labels():
+    registry = Registry()
+    counter = registry.counter("x", "x", ["a"])
+    assert registry.counter("x", "x", ["a"]) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("x", "x")
+    with pytest.raises(ValueError):
+        counter.inc(b="1")
+    with pytest.raises(ValueError):
+        registry.histogram("h", "h").observe(float("nan"))
+
+
+def test_decorators_feed_registry_only_when_enabled(metrics_on):
+    @memoize
+    def square(x):
+        return x * x
+
+    @retry(max_attempts=3, delay=0)
+    def flaky(state={"n": 0}):
+        state["n"] += 1
+        if state["n"] < 2:
+            raise ValueError("boom")
+        return state["n"]
+
+    @timeit()
+    @with_pause(seconds=0)
+    def quick():
+        return 1
+
+    square(2), square(2), square(3)
+    flaky()
+    quick()
+    enable_metrics(False)
+    square(2)
+
+    sq, fl, qk = function_label(square), function_label(flaky), function_label(quick)
+    assert REGISTRY.get("python_tools_memoize_hits").get(function=sq) == 1
+    assert REGISTRY.get("python_tools_memoize_misses").get(function=sq) == 2
+    assert REGISTRY.get("python_tools_retry_attempts").get(function=fl) == 2
+    assert REGISTRY.get("python_tools_retry_failures").get(function=fl) == 1
+    assert REGISTRY.get("python_tools_retry_giveups").get(function=fl) == 0
+    assert REGISTRY.get("python_tools_timeit_seconds").count(function=qk) == 1
+    assert f'python_tools_pause_seconds_total{{function="{qk}"}} 0' in render_openmetrics()
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_counts_hits_and_misses(metrics_on):
+    @memoize_async
+    async def double(x):
+        await asyncio.sleep(0)
+        return 2 * x
+
+    await double(1)
+    await double(1)
+    label = function_label(double)
+    assert REGISTRY.get("python_tools_memoize_hits").get(function=label) == 1
+    assert REGISTRY.get("python_tools_memoize_misses").get(function=label) == 1
+
+
+def test_metrics_server_serves_openmetrics():
+    registry = Registry()
+    registry.counter("served", "Requêtes").inc()
+    server = start_metrics_server(port=0, registry=registry)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as resp:
+            assert resp.headers["Content-Type"].startswith("application/openmetrics-text")
+            assert "served_total 1" in resp.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
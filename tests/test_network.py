@@ -0,0 +1,230 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from python_tools_sl.network import HttpClient, HttpStatusError, ResponseCache  # noqa: E402
+from python_tools_sl.utils.deadline import deadline  # noqa: E402
+
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def _route(self, flaky):
+        status, body, headers = 200, f"page {self.path}".encode(), {}
+        if flaky:
+            status, body = 503, b"busy"
+        elif self.path == "/fresh":
+            headers["Cache-Control"] = "max-age=60"
+        elif self.path == "/etag":
+            headers.update({"Cache-Control": "no-cache", "ETag": '"v1"'})
+            if self.headers.get("If-None-Match") == '"v1"':
+                status, body = 304, b""
+        elif self.path == "/lastmod":
+            headers.update({"Cache-Control": "max-age=0", "Last-Modified": LAST_MODIFIED})
+            if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                status, body = 304, b""
+        elif self.path == "/slow":
+            time.sleep(1)
+        elif self.path == "/vary":
+            headers.update({"Cache-Control": "max-age=60", "Vary": "Accept"})
+            body = f"page {self.headers.get('Accept')}".encode()
+        elif self.path == "/nostore":
+            headers["Cache-Control"] = "no-store, max-age=60"
+        return status, body, headers
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits.append((self.path, self.client_address, dict(self.headers)))
+            flaky = self.path == "/flaky" and len(server.hits) % 2 == 1
+        status, body, headers = self._route(flaky)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def http_server():
+    """Serveur HTTP/1.1 local qui enregistre chaque requête reçue."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.hits = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+@pytest.mark.asyncio
+async def test_http_client_reuses_connections(http_server):
+    async with HttpClient(limit_per_host=2) as client:
+        responses = await client.fetch_many(_url(http_server, f"/p{i}") for i in range(20))
+
+    assert [r.text for r in responses] == [f"page /p{i}" for i in range(20)]
+    # 20 pages, au plus 2 connexions TCP (une par port client)
+    assert len({addr for _, addr, _ in http_server.hits}) <= 2
+
+
+@pytest.mark.asyncio
+async def test_http_client_headers(http_server):
+    async with HttpClient(headers={"X-Token": "abc"}) as client:
+        await client.fetch(_url(http_server, "/"), headers={"X-Extra": "1"})
+
+    _, _, headers = http_server.hits[0]
+    assert headers["X-Token"] == "abc"
+    assert headers["X-Extra"] == "1"
+    assert "python-tools-sl" in headers["User-Agent"]
+
+
+@pytest.mark.asyncio
+async def test_http_client_retries_status(http_server):
+    async with HttpClient(retry_delay=0) as client:
+        response = await client.fetch(_url(http_server, "/flaky"))
+    assert response.status == 200
+    assert len(http_server.hits) == 2
+
+
+@pytest.mark.asyncio
+async def test_http_client_gives_up(http_server):
+    async with HttpClient(max_attempts=2, retry_delay=0, retry_statuses=(200,)) as client:
+        with pytest.raises(HttpStatusError):
+            await client.fetch(_url(http_server, "/"))
+    assert len(http_server.hits) == 2
+
+
+@pytest.mark.asyncio
+async def test_http_client_request_timeout_bounded_by_deadline(http_server):
+    start = time.monotonic()
+    async with HttpClient(timeout=30, retry_delay=0) as client:
+        with deadline(0.2), pytest.raises(TimeoutError):
+            await client.fetch(_url(http_server, "/slow"))
+    assert time.monotonic() - start < 0.9
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_fresh_response_locally(http_server):
+    async with HttpClient(cache=ResponseCache()) as client:
+        first = await client.fetch(_url(http_server, "/fresh"))
+        second = await client.fetch(_url(http_server, "/fresh"))
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text == "page /fresh"
+    assert len(http_server.hits) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/etag", "/lastmod"])
+async def test_cache_revalidates_with_304(http_server, path):
+    async with HttpClient(cache=ResponseCache()) as client:
+        await client.fetch(_url(http_server, path))
+        second = await client.fetch(_url(http_server, path))
+
+    assert second.from_cache
+    assert second.status == 200
+    assert second.text == f"page {path}"
+    assert len(http_server.hits) == 2
+    _, _, headers = http_server.hits[1]
+    assert "If-None-Match" in headers or "If-Modified-Since" in headers
+
+
+@pytest.mark.asyncio
+async def test_cache_honors_no_store(http_server):
+    async with HttpClient(cache=ResponseCache()) as client:
+        await client.fetch(_url(http_server, "/nostore"))
+        second = await client.fetch(_url(http_server, "/nostore"))
+    assert not second.from_cache
+    assert len(http_server.hits) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_disk_tier_survives_new_cache(http_server, tmp_path):
+    async with HttpClient(cache=ResponseCache(directory=tmp_path)) as client:
+        await client.fetch(_url(http_server, "/fresh"))
+
+    async with HttpClient(cache=ResponseCache(directory=tmp_path)) as client:
+        response = await client.fetch(_url(http_server, "/fresh"))
+
+    assert response.from_cache
+    assert response.text == "page /fresh"
+    assert len(http_server.hits) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_respects_vary(http_server):
+    url = _url(http_server, "/vary")
+    async with HttpClient(cache=ResponseCache()) as client:
+        json1 = await client.fetch(url, headers={"Accept": "application/json"})
+        json2 = await client.fetch(url, headers={"Accept": "application/json"})
+        html = await client.fetch(url, headers={"Accept": "text/html"})
+
+    assert json2.from_cache and json2.text == json1.text == "page application/json"
+    assert not html.from_cache
+    assert html.text == "page text/html"
+    assert len(http_server.hits) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_authorized_requests(http_server):
+    async with HttpClient(cache=ResponseCache()) as client:
+        for token in ("alice", "bob"):
+            response = await client.fetch(
+                _url(http_server, "/fresh"), headers={"Authorization": f"Bearer {token}"}
+            )
+            assert not response.from_cache
+    assert len(http_server.hits) == 2
+
+
+def test_response_cache_disk_size_limit(tmp_path):
+    from python_tools_sl.network import CacheEntry, Response
+
+    cache = ResponseCache(max_entries=1, directory=tmp_path, max_disk_bytes=5000)
+    for i in range(10):
+        response = Response(f"u{i}", 200, {"Cache-Control": "max-age=60"}, b"x" * 1000)
+        cache.set(f"u{i}", CacheEntry.from_response(response))
+
+    total = sum(p.stat().st_size for p in tmp_path.iterdir())
+    assert total <= 5000
+    assert cache.get("u9") is not None
+    # les plus anciennes ont été évincées du disque
+    assert ResponseCache(directory=tmp_path).get("u0") is None
+
+
+@pytest.mark.parametrize("age", ["1, 2", "-5", "nan", ""])
+def test_cache_entry_ignores_bad_age_header(age):
+    from python_tools_sl.network import CacheEntry, Response
+
+    response = Response("u", 200, {"Cache-Control": "max-age=60", "Age": age}, b"")
+    entry = CacheEntry.from_response(response)
+    assert entry.initial_age == 0.0
+    assert entry.is_fresh()
+
+
+def test_response_cache_lru_eviction():
+    from python_tools_sl.network import CacheEntry, Response
+
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        response = Response(key, 200, {"Cache-Control": "max-age=60"}, b"")
+        cache.set(key, CacheEntry.from_response(response))
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
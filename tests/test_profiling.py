@@ -0,0 +1,135 @@
+import asyncio
+import pstats
+import threading
+import tracemalloc
+
+import pytest
+
+from python_tools_sl.decorators import profile, profile_async, trace_memory, trace_memory_async
+from python_tools_sl.utils.profiling import PROFILE_ENV, TRACE_MEMORY_ENV, profiling, should_sample
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+
+def test_profile_writes_hotspots(tmp_path):
+    @profile(sample_rate=1.0, output_dir=tmp_path, top=5)
+    def work():
+        return _busy(10_000)
+
+    assert work() == _busy(10_000)
+    (report,) = tmp_path.glob("*.txt")
+    (prof,) = tmp_path.glob("*.prof")
+    assert "_busy" in report.read_text(encoding="utf-8")
+    assert pstats.Stats(str(prof)).total_calls > 0
+
+
+def test_profile_env_var_disables(tmp_path, monkeypatch):
+    monkeypatch.setenv(PROFILE_ENV, "0")
+
+    @profile(output_dir=tmp_path)
+    def work():
+        return 1
+
+    assert work() == 1
+    assert not any(tmp_path.iterdir())
+
+
+def test_should_sample(monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    assert should_sample(1.0, PROFILE_ENV)
+    assert not should_sample(0.0, PROFILE_ENV)
+    monkeypatch.setenv(PROFILE_ENV, "1")
+    assert should_sample(0.0, PROFILE_ENV)
+
+
+def test_profiling_nested_block_is_skipped(tmp_path):
+    with profiling("outer", tmp_path) as outer:
+        with profiling("inner", tmp_path) as inner:
+            _busy(100)
+    assert outer is not None
+    assert inner is None
+
+
+def test_trace_memory_reports_allocation_site(tmp_path):
+    @trace_memory(sample_rate=1.0, output_dir=tmp_path, top=3)
+    def allocate():
+        return [bytearray(1024) for _ in range(1000)]
+
+    data = allocate()
+    assert len(data) == 1000
+    (report,) = tmp_path.glob("*.mem.txt")
+    text = report.read_text(encoding="utf-8")
+    assert "pic mémoire" in text
+    assert "test_profiling.py" in text
+
+
+@pytest.mark.asyncio
+async def test_async_profile_and_trace_memory(tmp_path, monkeypatch):
+    monkeypatch.setenv(TRACE_MEMORY_ENV, "yes")
+
+    @profile_async(sample_rate=1.0, output_dir=tmp_path)
+    @trace_memory_async(output_dir=tmp_path, sample_rate=0.0)
+    async def work():
+        await asyncio.sleep(0)
+        return _busy(1000)
+
+    assert await work() == _busy(1000)
+    assert len(list(tmp_path.glob("*.mem.txt"))) == 1
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
+def test_profile_is_opt_in_and_capped(tmp_path, monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+
+    @profile(output_dir=tmp_path / "off")
+    def off():
+        return 1
+
+    @profile(sample_rate=1.0, output_dir=tmp_path / "capped", max_reports=2)
+    def capped():
+        return 1
+
+    for _ in range(5):
+        off(), capped()
+    assert not (tmp_path / "off").exists()
+    assert len(list((tmp_path / "capped").glob("*.prof"))) == 2
+
+
+@pytest.mark.asyncio
+async def test_trace_memory_async_overlapping_calls(tmp_path):
+    @trace_memory_async(sample_rate=1.0, output_dir=tmp_path)
+    async def work(delay):
+        data = [bytearray(100) for _ in range(100)]
+        await asyncio.sleep(delay)
+        return len(data)
+
+    assert await asyncio.gather(work(0.05), work(0.1)) == [100, 100]
+    assert len(list(tmp_path.glob("*.mem.txt"))) == 2
+    assert not tracemalloc.is_tracing()
+
+
+def test_trace_memory_threads(tmp_path):
+    barrier = threading.Barrier(4)
+    errors = []
+
+    @trace_memory(sample_rate=1.0, output_dir=tmp_path)
+    def work():
+        barrier.wait()
+        return [bytearray(100) for _ in range(100)]
+
+    def run():
+        try:
+            work()
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(list(tmp_path.glob("*.mem.txt"))) == 4
+    assert not tracemalloc.is_tracing()
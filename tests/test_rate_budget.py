@@ -0,0 +1,77 @@
+import multiprocessing
+import time
+
+import pytest
+
+from python_tools_sl.utils.rate_budget import FileRateBudget
+
+
+def _worker(path, n, queue):
+    budget = FileRateBudget(path, rate=20)
+    for _ in range(n):
+        budget.acquire()
+        queue.put(time.time())
+
+
+def test_rate_budget_burst_then_paced(tmp_path):
+    budget = FileRateBudget(tmp_path / "b.json", rate=10, burst=3)
+    waits = [budget.reserve() for _ in range(5)]
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3] == pytest.approx(0.1, abs=0.02)
+    assert waits[4] == pytest.approx(0.2, abs=0.02)
+
+
+def test_rate_budget_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        FileRateBudget(tmp_path / "b.json", rate=0)
+    with pytest.raises(ValueError):
+        FileRateBudget(tmp_path / "b.json", rate=1, burst=0)
+
+
+def test_rate_budget_shared_between_processes(tmp_path):
+    path = tmp_path / "shared.json"
+    queue = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_worker, args=(path, 4, queue)) for _ in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    stamps = sorted(queue.get() for _ in range(12))
+
+    # 12 appels à 20/s répartis sur 3 processus : ~0.55 s au total, jamais 2 au même instant
+    assert stamps[-1] - stamps[0] >= 0.5
+    assert min(b - a for a, b in zip(stamps, stamps[1:])) >= 0.03
+
+
+PACED_TESTS = """
+    import time
+    import pytest
+
+    @pytest.mark.rate_limited("api", rate=10)
+    @pytest.mark.parametrize("i", range(6))
+    def test_paced(i):
+        with open("stamps.txt", "a") as f:
+            f.write(f"{time.time()}\\n")
+"""
+
+
+def _stamps(pytester):
+    return sorted(float(x) for x in (pytester.path / "stamps.txt").read_text().split())
+
+
+def test_plugin_paces_marked_tests(pytester):
+    pytester.makepyfile(PACED_TESTS)
+    result = pytester.runpytest("-p", "python_tools_sl.pytest_plugin")
+    result.assert_outcomes(passed=6)
+    stamps = _stamps(pytester)
+    assert stamps[-1] - stamps[0] >= 0.45
+
+
+def test_plugin_paces_across_xdist_workers(pytester):
+    pytest.importorskip("xdist")
+    pytester.makepyfile(PACED_TESTS)
+    result = pytester.runpytest("-p", "python_tools_sl.pytest_plugin", "-n", "3")
+    result.assert_outcomes(passed=6)
+    stamps = _stamps(pytester)
+    assert stamps[-1] - stamps[0] >= 0.45
+    assert min(b - a for a, b in zip(stamps, stamps[1:])) >= 0.07
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from python_tools_sl.decorators import retry, retry_async, timeout, timeout_async
+from python_tools_sl.utils.deadline import DeadlineExceeded, deadline, remaining_time
+
+
+def test_timeout_sync_returns_result():
+    @timeout(1.0)
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+
+
+def test_timeout_sync_raises_on_hang():
+    @timeout(0.05)
+    def hang():
+        time.sleep(1)
+
+    start = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        hang()
+    assert time.perf_counter() - start < 0.5
+
+
+def test_timeout_sync_propagates_exception_and_deadline():
+    seen = []
+
+    @timeout(0.5)
+    def inner():
+        seen.append(remaining_time())
+        raise KeyError("x")
+
+    with pytest.raises(KeyError):
+        inner()
+    assert 0 < seen[0] <= 0.5
+
+
+def test_nested_timeout_uses_outer_deadline():
+    @timeout(10)
+    def inner():
+        return remaining_time()
+
+    with deadline(0.2):
+        assert inner() <= 0.2
+
+
+def test_retry_respects_deadline():
+    calls = []
+
+    @retry(max_attempts=5, delay=0.2)
+    def failing():
+        calls.append(1)
+        raise ValueError("boom")
+
+    start = time.perf_counter()
+    with deadline(0.3), pytest.raises(ValueError):
+        failing()
+    assert len(calls) == 2  # le 3e essai tomberait après la deadline
+    assert time.perf_counter() - start < 0.35
+
+
+@pytest.mark.asyncio
+async def test_timeout_async_cancels():
+    cancelled = []
+
+    @timeout_async(0.05)
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(DeadlineExceeded):
+        await slow()
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_timeout_async_keeps_own_timeout_error():
+    @timeout_async(0.01)
+    async def blocking():
+        time.sleep(0.05)  # bloque la boucle au-delà de la deadline
+        raise asyncio.TimeoutError("propre à la coroutine")
+
+    with pytest.raises(asyncio.TimeoutError, match="propre") as info:
+        await blocking()
+    assert not isinstance(info.value, DeadlineExceeded)
+
+
+@pytest.mark.asyncio
+async def test_timeout_async_bounds_retries_end_to_end():
+    calls = []
+
+    @timeout_async(0.25)
+    @retry_async(max_attempts=10, delay=0.1)
+    async def flaky():
+        calls.append(1)
+        raise ConnectionError("down")
+
+    start = time.perf_counter()
+    with pytest.raises(ConnectionError):
+        await flaky()
+    assert time.perf_counter() - start < 0.3
+    assert len(calls) < 10
+
+
+@pytest.mark.asyncio
+async def test_timeout_async_inherited_by_tasks():
+    async def child():
+        return remaining_time()
+
+    @timeout_async(0.5)
+    async def parent():
+        return await asyncio.create_task(child())
+
+    assert 0 < await parent() <= 0.5
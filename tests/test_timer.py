@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from python_tools_sl.utils.utils import TimerReport, timer
+
+
+def test_timer_nested_tree():
+    report = TimerReport()
+    with timer("outer", report=report, verbose=False):
+        for _ in range(2):
+            with timer("inner", report=report, verbose=False):
+                time.sleep(0.01)
+
+    outer = report.root.children["outer"]
+    inner = outer.children["inner"]
+    assert outer.count == 1
+    assert inner.count == 2
+    assert outer.total >= inner.total >= 0.02
+    assert outer.self_time == pytest.approx(outer.total - inner.total)
+
+
+def test_timer_threads_have_own_stack():
+    report = TimerReport()
+
+    def work():
+        with timer("thread", report=report, verbose=False):
+            time.sleep(0.01)
+
+    with timer("main", report=report, verbose=False):
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    # un thread ne voit pas le span du thread principal
+    assert report.root.children["thread"].count == 3
+    assert "thread" not in report.root.children["main"].children
+
+
+@pytest.mark.asyncio
+async def test_timer_asyncio_tasks_inherit_parent():
+    report = TimerReport()
+
+    async def work(i):
+        with timer("task", report=report, verbose=False):
+            await asyncio.sleep(0.01 * i)
+
+    with timer("request", report=report, verbose=False):
+        await asyncio.gather(*(work(i) for i in range(1, 4)))
+
+    request = report.root.children["request"]
+    assert request.children["task"].count == 3
+    # tâches concurrentes : le temps propre reste positif ou nul
+    assert request.self_time >= 0
+
+
+def test_timer_collapsed_and_by_name(tmp_path, capsys):
+    report = TimerReport()
+    with timer("a", report=report):
+        with timer("b", report=report, verbose=False):
+            time.sleep(0.005)
+    assert "[a] terminé en" in capsys.readouterr().out
+
+    stats = report.by_name()
+    assert stats["a"]["count"] == 1
+    assert stats["b"]["total"] == pytest.approx(stats["b"]["self"])
+
+    out = tmp_path / "profile.folded"
+    report.export_collapsed(out)
+    lines = out.read_text(encoding="utf-8").splitlines()
+    stacks = {line.rsplit(" ", 1)[0] for line in lines}
+    assert "a;b" in stacks
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)